@@ -0,0 +1,93 @@
+import os
+import json
+import numpy as np
+from multiprocessing import Pool
+
+from tangente_henon import lyapunov_henon
+
+# ================================
+# Balayage du plan (a, b) par blocs, avec reprise
+# ================================
+# Le plan des paramètres est découpé en blocs de taille x taille couples
+# (a, b), distribués à un groupe de processus. Chaque bloc terminé est
+# écrit dans le dossier du balayage (bloc_i_j.npy, écrit sous un nom
+# temporaire puis renommé : un fichier présent est toujours complet). Le
+# fichier parametres.json garde la grille et les options ; relancé sur le
+# même dossier, le balayage saute les blocs déjà présents. assembler_plan
+# relit les blocs à tout moment, même pendant le calcul, et masque les
+# cases manquantes.
+
+def _chemin_bloc(dossier, i, j):
+    return os.path.join(dossier, f"bloc_{i}_{j}.npy")
+
+def _blocs(n_b, n_a, taille):
+    """Blocs (i, j, lignes, colonnes) couvrant le plan (n_b, n_a)."""
+    return [(i, j, slice(r0, min(r0 + taille, n_b)), slice(c0, min(c0 + taille, n_a)))
+            for i, r0 in enumerate(range(0, n_b, taille))
+            for j, c0 in enumerate(range(0, n_a, taille))]
+
+def _python(v):
+    """Valeur convertie en types Python (scalaires NumPy compris), pour JSON."""
+    if isinstance(v, np.generic):
+        return v.item()
+    if isinstance(v, (list, tuple, np.ndarray)):
+        return [_python(w) for w in v]
+    if isinstance(v, dict):
+        return {k: _python(w) for k, w in v.items()}
+    return v
+
+def _lire_parametres(dossier):
+    with open(os.path.join(dossier, 'parametres.json')) as f:
+        return json.load(f)
+
+def _calcul_bloc(travail):
+    dossier, i, j, a, b, options = travail
+    LE = lyapunov_henon(a[None, :], b[:, None], **options)
+    chemin = _chemin_bloc(dossier, i, j)
+    with open(chemin + '.tmp', 'wb') as f:
+        np.save(f, LE)
+    os.replace(chemin + '.tmp', chemin)
+    return i, j
+
+def balayage_plan(dossier, a_vals, b_vals, taille=50, processus=None, **options):
+    """Calcule LE[b, a] (lyapunov_henon(a, b, **options)) bloc par bloc dans dossier.
+
+    Les blocs déjà présents dans dossier sont sautés. Retourne le nombre
+    de blocs calculés par cet appel.
+    """
+    options = _python(options)
+    params = {'a': [float(v) for v in a_vals], 'b': [float(v) for v in b_vals],
+              'taille': int(taille), 'options': options}
+    texte = json.dumps(params)
+    os.makedirs(dossier, exist_ok=True)
+    chemin_params = os.path.join(dossier, 'parametres.json')
+    if os.path.exists(chemin_params):
+        if _lire_parametres(dossier) != json.loads(texte):
+            raise ValueError(f"{dossier} correspond à un autre balayage")
+    else:
+        # Écrit sous un nom temporaire puis renommé, comme les blocs
+        with open(chemin_params + '.tmp', 'w') as f:
+            f.write(texte)
+        os.replace(chemin_params + '.tmp', chemin_params)
+
+    a_vals, b_vals = np.asarray(params['a']), np.asarray(params['b'])
+    travaux = [(dossier, i, j, a_vals[c], b_vals[r], options)
+               for i, j, r, c in _blocs(b_vals.size, a_vals.size, taille)
+               if not os.path.exists(_chemin_bloc(dossier, i, j))]
+    if not travaux:
+        return 0
+    with Pool(processus) as pool:
+        for _ in pool.imap_unordered(_calcul_bloc, travaux, chunksize=1):
+            pass
+    return len(travaux)
+
+def assembler_plan(dossier):
+    """(a_vals, b_vals, LE) ; LE est un tableau masqué (cases non calculées masquées)."""
+    params = _lire_parametres(dossier)
+    a_vals, b_vals = np.asarray(params['a']), np.asarray(params['b'])
+    LE = np.ma.masked_all((b_vals.size, a_vals.size))
+    for i, j, r, c in _blocs(b_vals.size, a_vals.size, params['taille']):
+        chemin = _chemin_bloc(dossier, i, j)
+        if os.path.exists(chemin):
+            LE[r, c] = np.load(chemin)
+    return a_vals, b_vals, LE
@@ -1,86 +1,37 @@
 import numpy as np
 import matplotlib.pyplot as plt
-
-# -------------------------------
-# Fonctions utilitaires
-# -------------------------------
-def aron(x):
-    """Si imag(x) est très petit, force partie imag à 0."""
-    return complex(np.real(x), 0.0) if abs(np.imag(x)) < 1e-8 else x
-
-def som(m):
-    """Somme des 3^k de k=0 à m."""
-    return sum(3**k for k in range(m+1))
-
-def argument(x):
-    """Argument complexe en radians."""
-    pi = 2.0 * np.arccos(0.0)
-    if np.real(x) < 0.0 and abs(np.imag(x)) < 1e-18:
-        return pi
-    else:
-        return 2.0 * np.arctan(np.imag(x) / (np.real(x) + abs(x)))
-
-def cub(x, k):
-    """Racine cubique complexe avec branche k."""
-    pi = 2.0 * np.arccos(0.0)
-    aa = argument(x)
-    bb = abs(x)
-    return bb**(1.0/3.0) * complex(np.cos((aa + 2*k*pi)/3.0),
-                                   np.sin((aa + 2*k*pi)/3.0))
-
-def phie(z, k):
-    """Fonction phie."""
-    return cub(-2.0 + z**3 + 2.0*np.sqrt(1.0 - z**3), k) + \
-           (z**2) / cub(-2.0 + z**3 + 2.0*np.sqrt(1.0 - z**3), k)
-
-def psi(z, k):
-    """Fonction psi."""
-    return cub(-2.0 + z**3 + 2.0*np.sqrt(1.0 - z**3), k) - \
-           (z**2) / cub(-2.0 + z**3 + 2.0*np.sqrt(1.0 - z**3), k)
-
-def xster(x):
-    return (2.0*np.real(x)) / (abs(x)**2 + 1.0)
-
-def yster(x):
-    return (2.0*np.imag(x)) / (abs(x)**2 + 1.0)
-
-def zster(x):
-    return -((abs(x)**2 - 1.0) / (abs(x)**2 + 1.0))
-
-def rec(x, k):
-    return 0.5 * (phie(x, k) + x)
+from julia_inverse import arbre_inverse
+from julia_stockage import ecrire_points
 
 # -------------------------------
 # Programme principal
 # -------------------------------
 kmax = 13  # réduire un peu pour tests rapides
-z1 = complex(-(0.5) * 2**(2.0/3.0), 0.0)
-z2 = complex((0.25) * 2**(2.0/3.0),
-             -(0.25) * np.sqrt(3) * 2**(2.0/3.0))
-z3 = complex((0.25) * 2**(2.0/3.0),
-              (0.25) * np.sqrt(3) * 2**(2.0/3.0))
 
-# Initialisation de A
-A = np.zeros(som(kmax), dtype=complex)
-A[0] = 0.0 + 0.0j
-A[1] = z1
-A[2] = z2
-A[3] = z3
-
-# Remplissage récursif
-for k in range(1, kmax):
-    c = 0
-    deb = som(k-1)
-    fin = som(k)
-    for i in range(deb, fin):
-        for j in range(1, 4):
-            c += 1
-            A[fin + c - 1] = aron(rec(A[i], j))
-
-# -------------------------------
-# Sauvegarde en .dat
-# -------------------------------
-np.savetxt("out.dat", np.column_stack((np.real(A), np.imag(A))))
+# Remplissage niveau par niveau (vectorisé, voir julia_inverse.py) :
+# un niveau entier est calculé d'un coup au lieu de aron(rec(A[i], j))
+A = arbre_inverse(kmax)
+# Grandes profondeurs (kmax >= 18) : expansion en flux, mémoire bornée
+#from julia_inverse import blocs_inverse, consommer, PuitsDensite
+#densite = PuitsDensite(800, 800)
+#consommer(blocs_inverse(18), densite)
+#plt.imshow(np.log1p(densite.image), origin='lower', extent=[-2, 2, -2, 2])
+# Itération inverse modifiée (élagage des cases saturées) :
+# Les points gardés sont écrits niveau par niveau par le puits StockPoints
+# (ecrire_points ci-dessous suppose la disposition de arbre_inverse) :
+#from julia_inverse import iteration_inverse_modifiee
+#from julia_stockage import StockPoints
+#with StockPoints("out_modifie.pts", 60, saturation=2) as stock:
+#    A, occupation, evaluations = iteration_inverse_modifiee(60, 800, 800, saturation=2, puits=stock)
+
+# -------------------------------
+# Sauvegarde
+# -------------------------------
+# Fichier binaire (en-tête + complex128, relu par memmap avec lire_points)
+ecrire_points("out.pts", A, kmax)
+# Export texte explicite, si besoin de l'ancien out.dat :
+#from julia_stockage import exporter_texte
+#exporter_texte("out.pts", "out.dat")
 
 # -------------------------------
 # Tracé Matplotlib
@@ -1,28 +1,26 @@
-import numpy as np
 import matplotlib.pyplot as plt
+from temps_echappement import julia
 
 # Paramètre de la fonction
 #c = -0.8 + 0.156j
 c =-0.123 + 0.745j
 #c=-1
 #c=0
+# Animation le long du bord de l'ensemble de Mandelbrot (600 images) :
+#from julia_balayage import balayage_julia, bord_cardioide
+#balayage_julia(bord_cardioide(600, 0.01), 'julia_frames')
 # Taille et domaine
 width, height = 800, 800
 xmin, xmax = -1.5, 1.5
 ymin, ymax = -1.5, 1.5
 max_iter = 300
 
-# Grille complexe
-x = np.linspace(xmin, xmax, width)
-y = np.linspace(ymin, ymax, height)
-X, Y = np.meshgrid(x, y)
-Z = X + 1j * Y
-img = np.zeros(Z.shape, dtype=int)
-
-for i in range(max_iter):
-    mask = np.abs(Z) <= 2
-    Z[mask] = Z[mask] ** 2 + c
-    img[mask] += 1
+# Grille complexe et temps d'échappement (pixels actifs seulement)
+x, y, img = julia(c, width, height, max_iter, xmin, xmax, ymin, ymax)
+# Coloration continue et distance au bord dans la même passe :
+#from temps_echappement import grille, echappement_julia_lisse
+#x, y, Z = grille(width, height, xmin, xmax, ymin, ymax)
+#img, img_lisse, distance = echappement_julia_lisse(Z, c, max_iter, rayon=1e3)
 
 plt.figure(figsize=(8, 8))
 plt.imshow(img, extent=[xmin, xmax, ymin, ymax], cmap='inferno', origin='lower')
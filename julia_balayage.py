@@ -0,0 +1,51 @@
+import os
+import numpy as np
+import matplotlib.pyplot as plt
+
+from noyaux_iteration import EspaceTravail, julia_lot_noyau
+
+# ================================
+# Balayages de Julia par lots
+# ================================
+# julia_0.py calcule un seul c à la fois. Ici un tableau de valeurs de c
+# est évalué par lots de quelques images (axe de lot en tête) : la grille
+# est construite une seule fois, les tampons de l'espace de travail et le
+# tampon d'images sont réutilisés d'un lot à l'autre, et chaque image
+# terminée est écrite sur disque en séquence numérotée.
+
+def bord_cardioide(n, decalage=0.0):
+    """n valeurs de c sur le bord de la cardioïde principale.
+
+    c = e^{it}/2 - e^{2it}/4 ; decalage > 0 écarte le chemin vers l'extérieur.
+    """
+    t = np.linspace(0, 2 * np.pi, n, endpoint=False)
+    u = np.exp(1j * t)
+    return u / 2 - u**2 / 4 + decalage * u
+
+def balayage_julia(cs, dossier, width=800, height=800, max_iter=300,
+                   xmin=-1.5, xmax=1.5, ymin=-1.5, ymax=1.5,
+                   lot=4, cmap='inferno', prefixe='julia'):
+    """Calcule les ensembles de Julia pour chaque c de cs et écrit les images.
+
+    Les images sont écrites dans dossier sous la forme prefixe_0000.png, ...
+    Au plus lot images sont en mémoire à la fois. Retourne la liste des fichiers.
+    """
+    os.makedirs(dossier, exist_ok=True)
+    x = np.linspace(xmin, xmax, width)
+    y = np.linspace(ymin, ymax, height)
+    X, Y = np.meshgrid(x, y)
+    Z = X + 1j * Y
+
+    cs = np.asarray(cs, dtype=complex)
+    espace = EspaceTravail()
+    images = np.empty((lot, height, width), dtype=int)
+    fichiers = []
+    for debut in range(0, len(cs), lot):
+        bloc = cs[debut:debut + lot]
+        tampon = images[:len(bloc)]
+        julia_lot_noyau(Z, bloc, max_iter, espace=espace, out=tampon)
+        for k, img in enumerate(tampon):
+            nom = os.path.join(dossier, f"{prefixe}_{debut + k:04d}.png")
+            plt.imsave(nom, img, cmap=cmap, origin='lower', vmin=0, vmax=max_iter)
+            fichiers.append(nom)
+    return fichiers
@@ -0,0 +1,200 @@
+import numpy as np
+
+# ================================
+# Itération inverse, niveau par niveau
+# ================================
+# Construction vectorisée de l'arbre des préimages de julia.py : au lieu
+# d'appeler aron(rec(A[i], j)) point par point, un niveau entier est traité
+# comme un tableau. La racine sqrt(1 - z^3), l'argument et le module de
+# w = -2 + z^3 + 2 sqrt(1 - z^3) sont calculés une seule fois, puis les
+# trois branches de la racine cubique sont obtenues par opérations sur
+# tableaux et écrites directement dans la tranche du niveau suivant.
+# La disposition de A est celle de julia.py : A[0] = 0, puis les niveaux
+# successifs, les trois images de A[i] étant rangées consécutivement.
+
+pi = 2.0 * np.arccos(0.0)
+
+def som(m):
+    """Somme des 3^k de k=0 à m."""
+    return (3**(m + 1) - 1) // 2
+
+def argument(x):
+    """Argument complexe en radians (version tableau de julia.py)."""
+    re, im = np.real(x), np.imag(x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = 2.0 * np.arctan(im / (re + np.abs(x)))
+    return np.where((re < 0.0) & (np.abs(im) < 1e-18), pi, a)
+
+def aron(x):
+    """Si imag(x) est très petit, force partie imag à 0."""
+    return np.where(np.abs(np.imag(x)) < 1e-8, np.real(x) + 0.0j, x)
+
+def rec_niveau(z, out):
+    """Écrit dans out (forme (n, 3)) les trois images rec(z, k), k = 1, 2, 3."""
+    z3 = z**3
+    w = -2.0 + z3 + 2.0 * np.sqrt(1.0 - z3)
+    aa = argument(w)
+    r = np.abs(w)**(1.0 / 3.0)
+    z2 = z**2
+    for k in range(1, 4):
+        theta = (aa + 2 * k * pi) / 3.0
+        c = r * (np.cos(theta) + 1j * np.sin(theta))
+        out[:, k - 1] = aron(0.5 * ((c + z2 / c) + z))
+    return out
+
+def points_initiaux():
+    """Niveau 1 de julia.py : les trois points z1, z2, z3."""
+    return np.array([complex(-(0.5) * 2**(2.0/3.0), 0.0),
+                     complex((0.25) * 2**(2.0/3.0), -(0.25) * np.sqrt(3) * 2**(2.0/3.0)),
+                     complex((0.25) * 2**(2.0/3.0), (0.25) * np.sqrt(3) * 2**(2.0/3.0))])
+
+def arbre_inverse(kmax):
+    """Tableau A de julia.py (som(kmax) points), rempli niveau par niveau."""
+    A = np.zeros(som(kmax), dtype=complex)
+    A[1:4] = points_initiaux()
+    for k in range(1, kmax):
+        deb, fin = som(k - 1), som(k)
+        rec_niveau(A[deb:fin], A[fin:som(k + 1)].reshape(-1, 3))
+    return A
+
+# ================================
+# Expansion en flux, mémoire bornée
+# ================================
+# arbre_inverse alloue som(kmax) = (3^(kmax+1) - 1) / 2 points d'un coup,
+# alors que seul le niveau précédent sert à construire le suivant. Ici
+# l'arbre est parcouru en profondeur par blocs d'au plus taille_bloc
+# points : chaque bloc terminé est passé aux puits (écriture sur disque,
+# image de densité, ...) puis abandonné. La mémoire de pointe vaut environ
+# 3 * taille_bloc * kmax points, quel que soit 3^kmax.
+
+def blocs_inverse(kmax, taille_bloc=3**10):
+    """Génère des couples (niveau, points) couvrant les points de arbre_inverse(kmax).
+
+    L'ordre des points diffère de celui de A (parcours en profondeur).
+    """
+    yield 0, np.zeros(1, dtype=complex)
+    pile = [(1, points_initiaux())]
+    while pile:
+        k, z = pile.pop()
+        yield k, z
+        if k < kmax:
+            enfants = rec_niveau(z, np.empty((z.size, 3), dtype=complex)).reshape(-1)
+            # Les blocs sont empilés à l'envers pour être traités dans l'ordre
+            for debut in reversed(range(0, enfants.size, taille_bloc)):
+                pile.append((k + 1, enfants[debut:debut + taille_bloc]))
+
+def consommer(blocs, *puits):
+    """Passe chaque bloc (niveau, points) à tous les puits ; retourne le nombre de points."""
+    total = 0
+    for k, z in blocs:
+        for p in puits:
+            p(k, z)
+        total += z.size
+    return total
+
+class PuitsTexte:
+    """Ajoute les points au fichier texte (format out.dat de julia.py)."""
+
+    def __init__(self, chemin):
+        self.fichier = open(chemin, 'w')
+
+    def __call__(self, k, z):
+        np.savetxt(self.fichier, np.column_stack((np.real(z), np.imag(z))))
+
+    def fermer(self):
+        self.fichier.close()
+
+class PuitsDensite:
+    """Histogramme 2D des points (image de densité prête pour imshow)."""
+
+    def __init__(self, width=800, height=800, x_min=-2, x_max=2, y_min=-2, y_max=2):
+        self.bornes = [[y_min, y_max], [x_min, x_max]]
+        self.image = np.zeros((height, width), dtype=np.int64)
+
+    def __call__(self, k, z):
+        h, _, _ = np.histogram2d(np.imag(z), np.real(z), bins=self.image.shape, range=self.bornes)
+        self.image += h.astype(np.int64)
+
+# ================================
+# Itération inverse modifiée
+# ================================
+# La plupart des 3^k points s'entassent dans les parties déjà denses de
+# l'ensemble. On tient une table de hachage spatiale des cases visitées
+# (cases de la taille d'un pixel de la fenêtre) : un point n'est gardé, et
+# développé au niveau suivant, que si sa case contient moins de saturation
+# points ; les branches qui tombent dans une case saturée sont abandonnées.
+# Le budget de points va ainsi aux parties du bord encore peu résolues.
+# Les points qui sortent de la fenêtre élargie de marge fois sa taille de
+# chaque côté sont abandonnés : la branche de rec qui part vers l'infini
+# tomberait sinon toujours dans une case neuve (l'expansion ne saturerait
+# jamais), et pour |z| très grand les annulations de rec_niveau renvoient
+# des points faux dans la fenêtre. Des points assez éloignés reviennent
+# pourtant dans la fenêtre : la marge par défaut (100 fenêtres) garde
+# l'essentiel de la couverture. Les indices de case restent bornés, et
+# les clés tiennent dans un int64.
+
+def _cles(z, width, height, x_min, x_max, y_min, y_max, marge=100.0):
+    """Clé entière de la case (taille d'un pixel) de chaque point, et masque des
+    points dans la fenêtre élargie de marge fois sa taille de chaque côté."""
+    mx, my = int(np.ceil(marge * width)), int(np.ceil(marge * height))
+    ix = np.floor((np.real(z) - x_min) / (x_max - x_min) * width)
+    iy = np.floor((np.imag(z) - y_min) / (y_max - y_min) * height)
+    dedans = (ix >= -mx) & (ix < width + mx) & (iy >= -my) & (iy < height + my)
+    ix = np.where(dedans, ix, 0).astype(np.int64) + mx
+    iy = np.where(dedans, iy, 0).astype(np.int64) + my
+    return ix * (height + 2 * my) + iy, dedans
+
+def iteration_inverse_modifiee(kmax, width=800, height=800, x_min=-2, x_max=2, y_min=-2, y_max=2,
+                               saturation=1, marge=100.0, puits=None):
+    """Points de l'itération inverse avec élagage par occupation des cases.
+
+    Retourne (points, occupation, evaluations) : points gardés, image
+    (height, width) du nombre de points par pixel de la fenêtre, et
+    nombre d'appels à rec. Les points hors de la fenêtre élargie de marge
+    fois sa taille de chaque côté sont abandonnés. puits(k, z), s'il est
+    donné, reçoit les points gardés de chaque niveau k (comme pour consommer).
+    """
+    cles = np.empty(0, dtype=np.int64)       # table triée des cases visitées
+    comptes = np.empty(0, dtype=np.int64)
+    gardes = [np.zeros(1, dtype=complex)]
+    if puits is not None:
+        puits(0, gardes[0])
+    evaluations = 0
+    z = points_initiaux()
+    for k in range(1, kmax + 1):
+        with np.errstate(invalid='ignore'):
+            cle, dedans = _cles(z, width, height, x_min, x_max, y_min, y_max, marge)
+        z, cle = z[dedans], cle[dedans]
+
+        # Rang de chaque point parmi ceux du même niveau tombant dans sa case
+        ordre = np.argsort(cle, kind='stable')
+        triees = cle[ordre]
+        debut = np.flatnonzero(np.r_[True, triees[1:] != triees[:-1]])
+        rang = np.empty_like(cle)
+        rang[ordre] = np.arange(cle.size) - np.repeat(debut, np.diff(np.r_[debut, cle.size]))
+
+        # Occupation déjà acquise aux niveaux précédents
+        deja = np.zeros(cle.size, dtype=np.int64)
+        if cles.size:
+            pos = np.minimum(np.searchsorted(cles, cle), cles.size - 1)
+            connu = cles[pos] == cle
+            deja[connu] = comptes[pos[connu]]
+
+        garde = deja + rang < saturation
+        z, cle = z[garde], cle[garde]
+        tout = np.concatenate([cles, cle])
+        cles, inverse = np.unique(tout, return_inverse=True)
+        comptes = np.bincount(inverse, weights=np.r_[comptes, np.ones(cle.size)]).astype(np.int64)
+
+        gardes.append(z)
+        if puits is not None:
+            puits(k, z)
+        if k == kmax or z.size == 0:
+            break
+        z = rec_niveau(z, np.empty((z.size, 3), dtype=complex)).reshape(-1)
+        evaluations += z.size
+
+    points = np.concatenate(gardes)
+    occupation, _, _ = np.histogram2d(np.imag(points), np.real(points), bins=(height, width),
+                                      range=[[y_min, y_max], [x_min, x_max]])
+    return points, occupation.astype(np.int64), evaluations
@@ -0,0 +1,93 @@
+import json
+import numpy as np
+
+# ================================
+# Stockage binaire des points
+# ================================
+# np.savetxt écrit les millions de points de julia.py en texte, ligne par
+# ligne : lent, environ 3 fois plus gros que le binaire, et lent à relire.
+# Format d'un fichier de points :
+#   - MAGIE (8 octets) puis un en-tête JSON complété par des espaces
+#     jusqu'à TAILLE_ENTETE octets : kmax, application, paramètres de
+#     génération, nombre de points et nombre de points par niveau ;
+#   - les points en complex128, ajoutés à la suite au fil des niveaux.
+# L'en-tête a une taille fixe : il est réécrit en place à chaque ajout, et
+# la lecture se fait par np.memmap sans rien charger.
+
+MAGIE = b'JULIAPTS'
+TAILLE_ENTETE = 4096
+APPLICATION = "rec(z, k) = (phie(z, k) + z) / 2, k = 1, 2, 3"
+
+class StockPoints:
+    """Écriture par blocs d'un fichier de points (utilisable comme puits)."""
+
+    def __init__(self, chemin, kmax, application=APPLICATION, **parametres):
+        self.entete = {'kmax': kmax, 'application': application,
+                       'parametres': parametres, 'n': 0, 'niveaux': {}}
+        self.fichier = open(chemin, 'w+b')
+        self._ecrire_entete()
+
+    def _ecrire_entete(self):
+        texte = json.dumps(self.entete).encode()
+        if len(MAGIE) + len(texte) > TAILLE_ENTETE:
+            raise ValueError("en-tête trop long pour TAILLE_ENTETE")
+        self.fichier.seek(0)
+        self.fichier.write(MAGIE + texte.ljust(TAILLE_ENTETE - len(MAGIE)))
+
+    def ajouter(self, niveau, z):
+        """Ajoute les points z (d'un même niveau) à la fin du fichier."""
+        z = np.ascontiguousarray(z, dtype=np.complex128)
+        self.fichier.seek(TAILLE_ENTETE + 16 * self.entete['n'])
+        self.fichier.write(z.tobytes())
+        self.entete['n'] += z.size
+        cle = str(niveau)
+        self.entete['niveaux'][cle] = self.entete['niveaux'].get(cle, 0) + z.size
+        self._ecrire_entete()
+
+    __call__ = ajouter
+
+    def fermer(self):
+        self.fichier.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fermer()
+
+def ecrire_points(chemin, A, kmax, **parametres):
+    """Écrit le tableau A de julia.py (disposition de arbre_inverse), niveau par niveau.
+
+    Pour d'autres générateurs (iteration_inverse_modifiee, blocs_inverse),
+    passer un StockPoints comme puits : il reçoit les vrais niveaux.
+    """
+    if A.size != (3**(kmax + 1) - 1) // 2:
+        raise ValueError("A n'a pas la disposition de arbre_inverse(kmax)")
+    with StockPoints(chemin, kmax, **parametres) as stock:
+        stock.ajouter(0, A[:1])
+        deb = 1
+        for k in range(1, kmax + 1):
+            fin = min(deb + 3**k, A.size)
+            stock.ajouter(k, A[deb:fin])
+            deb = fin
+
+def lire_points(chemin):
+    """Retourne (entete, points) ; points est un memmap en lecture seule."""
+    with open(chemin, 'rb') as f:
+        brut = f.read(TAILLE_ENTETE)
+    if brut[:len(MAGIE)] != MAGIE:
+        raise ValueError(f"{chemin} n'est pas un fichier de points")
+    entete = json.loads(brut[len(MAGIE):].decode())
+    if entete['n'] == 0:
+        return entete, np.empty(0, dtype=np.complex128)
+    points = np.memmap(chemin, dtype=np.complex128, mode='r',
+                       offset=TAILLE_ENTETE, shape=(entete['n'],))
+    return entete, points
+
+def exporter_texte(chemin, sortie, taille_bloc=10**6):
+    """Export texte au format out.dat (colonnes Re, Im), bloc par bloc."""
+    _, points = lire_points(chemin)
+    with open(sortie, 'w') as f:
+        for debut in range(0, points.size, taille_bloc):
+            z = points[debut:debut + taille_bloc]
+            np.savetxt(f, np.column_stack((np.real(z), np.imag(z))))
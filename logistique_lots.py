@@ -0,0 +1,47 @@
+import numpy as np
+
+from lyapunov_adaptatif import pas_lyapunov_logistique
+
+# ================================
+# Lyapunov et bifurcation de la logistique en un seul passage
+# ================================
+# lyapunov_diag_bif_logistique.py calcule l'exposant valeur par valeur
+# (boucle Python sur a et sur les itérations, np.abs / np.log sur des
+# scalaires), puis refait une orbite pour le diagramme de bifurcation.
+# Ici toutes les valeurs de a avancent ensemble ; les termes log |f'(x)|
+# invalides (x hors de [0, 1], dérivée hors de ]1e-10, 1e10[) sont masqués
+# voie par voie, et les n_bif derniers points de la même orbite servent au
+# diagramme de bifurcation.
+
+def lyapunov_bifurcation_logistique(a, x0=0.5, n_transitoire=1000, n_lyap=5000, n_bif=100):
+    """Exposant et points de bifurcation pour chaque valeur de a.
+
+    Retourne (exposant, bif) : exposant a la forme de a (nan sans point
+    valide), bif a la forme (n_bif,) + forme de a et contient les n_bif
+    derniers points de l'orbite (n_bif <= n_lyap).
+    """
+    if not 0 <= n_bif <= n_lyap:
+        raise ValueError("n_bif doit être compris entre 0 et n_lyap")
+    a = np.asarray(a, dtype=float)
+    forme = a.shape
+    a = a.ravel()
+    x = np.full(a.size, x0)
+    somme = np.zeros(a.size)
+    valides = np.zeros(a.size, dtype=int)
+    bif = np.empty((n_bif, a.size))
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for _ in range(n_transitoire):
+            x = a * x * (1.0 - x)
+        for i in range(n_lyap):
+            (x, _), terme, valide, _ = pas_lyapunov_logistique((x, a))
+            somme += np.where(valide, terme, 0.0)
+            valides += valide
+            k = i - (n_lyap - n_bif)
+            if k >= 0:
+                bif[k] = x
+
+    exposant = np.full(a.size, np.nan)
+    ok = valides > 0
+    exposant[ok] = somme[ok] / valides[ok]
+    return exposant.reshape(forme), bif.reshape((n_bif,) + forme)
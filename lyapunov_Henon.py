@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from tangente_henon import lyapunov_henon
 
 # Paramètres de la simulation
 b = 0.3  # Paramètre b fixé
@@ -12,64 +13,22 @@ lyap_threshold = 100  # Seuil pour les valeurs divergentes
 
 # Initialisation
 a_values = np.linspace(a_min, a_max, a_steps)
-lyap_exponents = np.zeros(a_steps)
 
-# Fonction pour calculer le Jacobien
-def jacobian(x, a, b):
-    return np.array([[-2*a*x, 1], 
-                    [b, 0]])
+# Calcul de l'exposant de Lyapunov pour toutes les valeurs de a à la fois :
+# orbite et vecteur tangent (1, 0) avancent ensemble, jacobienne au point
+# courant, valeur nan si la norme d'un pas dépasse lyap_threshold
+lyap_exponents = lyapunov_henon(a_values, b, 0.0, 0.0, n_transitoire=n_transient,
+                                n_iter=n_lyap, seuil=lyap_threshold)
 
-# Calcul de l'exposant de Lyapunov pour chaque a
-for idx, a in enumerate(a_values):
-    # Initialisation de l'orbite
-    x, y = 0.0, 0.0
-    
-    # Élimination du transitoire
-    for _ in range(n_transient):
-        x_new = 1 - a*x**2 + y
-        y = b*x
-        x = x_new
-    
-    # Vecteur tangent initial (normalisé)
-    v = np.array([1.0, 0.0])
-    v /= np.linalg.norm(v)
-    
-    # Somme pour l'exposant de Lyapunov
-    lyap_sum = 0.0
-    diverged = False
-    
-    # Calcul de l'exposant
-    for i in range(n_lyap):
-        # Mise à jour de l'orbite
-        x_new = 1 - a*x**2 + y
-        y = b*x
-        x = x_new
-        
-        # Calcul du Jacobien au point courant
-        J = jacobian(x, a, b)
-        
-        # Application du Jacobien au vecteur tangent
-        v_new = J @ v
-        
-        # Calcul de la norme
-        norm_v = np.linalg.norm(v_new)
-        
-        # Vérification de la divergence
-        if norm_v > lyap_threshold or np.isnan(norm_v):
-            diverged = True
-            break
-        
-        # Ré-normalisation du vecteur tangent
-        v = v_new / norm_v
-        
-        # Accumulation du log de la norme
-        lyap_sum += np.log(norm_v)
-    
-    # Calcul de l'exposant final
-    if diverged:
-        lyap_exponents[idx] = np.nan
-    else:
-        lyap_exponents[idx] = lyap_sum / n_lyap
+# Variante : arrêt de chaque valeur de a dès que l'erreur standard (par
+# moyennes de blocs) passe sous tol ; demi_largeur donne l'intervalle de confiance
+# from lyapunov_adaptatif import lyapunov_henon_adaptatif
+# lyap_exponents, demi_largeur, n_pas = lyapunov_henon_adaptatif(
+#     a_values, b, 0.0, 0.0, n_transitoire=n_transient, n_max=n_lyap, seuil=lyap_threshold, tol=1e-3)
+
+# Variante : grille non uniforme, raffinée autour des passages par zéro et des sauts
+# from raffinement_lyapunov import raffinement_henon
+# a_values, lyap_exponents, transitions, sens = raffinement_henon(a_min, a_max, b, resolution=1e-4)
 
 # Tracé du résultat
 plt.figure(figsize=(10, 6))
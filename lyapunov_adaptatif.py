@@ -0,0 +1,154 @@
+import numpy as np
+
+from tangente_henon import pas_henon, pas_tangent
+
+# ================================
+# Exposants de Lyapunov avec arrêt adaptatif
+# ================================
+# Les scripts font un nombre fixe de pas par paramètre (n_lyap = 10000,
+# N = 1000, 5000), même quand la moyenne ne bouge plus depuis longtemps ou
+# que l'orbite diverge. Ici chaque paramètre est une voie d'un tableau ;
+# les termes log |f'| sont regroupés en blocs de bloc pas. La moyenne des
+# blocs donne la moyenne courante, et leur dispersion l'erreur standard :
+#     erreur = ecart_type(moyennes de blocs) / sqrt(nombre de blocs),
+# les blocs étant assez longs pour être à peu près indépendants. À la fin
+# de chaque bloc, une voie est retirée (compaction) dès que son erreur
+# passe sous tol (après au moins blocs_min blocs), ou si elle diverge
+# (valeur nan). Dans les fenêtres périodiques les blocs sont presque
+# identiques et la voie s'arrête après quelques blocs.
+
+def lyapunov_adaptatif(pas, etat, n_max, bloc=100, blocs_min=5, tol=1e-3, z=1.96):
+    """Moyenne des termes de pas par voie, arrêtée à erreur < tol ou après n_max pas.
+
+    etat : tuple de tableaux de même taille (une voie par élément, paramètres
+    compris). pas(etat) retourne (etat, terme, valide, diverge) : seuls les
+    termes valides comptent (valide None : tous), une voie divergente vaut
+    nan (diverge peut être None). Retourne (exposant, demi_largeur, n_pas) :
+    l'intervalle de confiance est exposant +- demi_largeur (z erreurs standard).
+    """
+    n = etat[0].size
+    exposant = np.full(n, np.nan)
+    demi_largeur = np.full(n, np.nan)
+    n_pas = np.zeros(n, dtype=int)
+    idx = np.arange(n)
+    somme = np.zeros(n)          # somme des termes valides
+    compte = np.zeros(n)         # nombre de termes valides
+    S = np.zeros(n)              # somme des moyennes de blocs
+    S2 = np.zeros(n)             # somme de leurs carrés
+    nb = np.zeros(n)             # nombre de blocs non vides
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for debut in range(0, n_max, bloc):
+            m = idx.size
+            longueur = min(bloc, n_max - debut)
+            somme_bloc = np.zeros(m)
+            compte_bloc = np.zeros(m)
+            mort = np.zeros(m, dtype=bool)
+            for _ in range(longueur):
+                etat, terme, valide, diverge = pas(etat)
+                if diverge is not None:
+                    mort |= diverge
+                # Une voie morte peut accumuler nan : elle vaudra nan de toute façon
+                if valide is None:
+                    somme_bloc += terme
+                    compte_bloc += 1
+                else:
+                    somme_bloc += np.where(valide, terme, 0.0)
+                    compte_bloc += valide
+            for t in etat:
+                mort |= ~np.isfinite(t)
+
+            somme += somme_bloc
+            compte += compte_bloc
+            plein = compte_bloc > 0
+            moyenne_bloc = np.where(plein, somme_bloc / np.maximum(compte_bloc, 1), 0.0)
+            S += moyenne_bloc
+            S2 += moyenne_bloc**2
+            nb += plein
+            n_pas[idx] += longueur
+
+            variance = np.maximum(S2 / np.maximum(nb, 1) - (S / np.maximum(nb, 1))**2, 0.0)
+            erreur = np.sqrt(variance / np.maximum(nb - 1, 1))
+            fini = mort | ((nb >= blocs_min) & (erreur <= tol)) | (debut + longueur >= n_max)
+
+            if fini.any():
+                f = idx[fini]
+                exposant[f] = np.where(mort[fini] | (compte[fini] == 0), np.nan,
+                                       somme[fini] / np.maximum(compte[fini], 1))
+                demi_largeur[f] = np.where(np.isnan(exposant[f]), np.nan, z * erreur[fini])
+                garde = ~fini
+                etat = tuple(t[garde] for t in etat)
+                idx, somme, compte = idx[garde], somme[garde], compte[garde]
+                S, S2, nb = S[garde], S2[garde], nb[garde]
+                if idx.size == 0:
+                    break
+
+    return exposant, demi_largeur, n_pas
+
+# -------------------------------
+# Hénon
+# -------------------------------
+def pas_lyapunov_henon(jacobien_avant=False, seuil=None):
+    """Pas pour lyapunov_adaptatif, état (x, y, vx, vy, a, b) (conventions de lyapunov_henon)."""
+    def pas(etat):
+        x, y, vx, vy, a, b = etat
+        x_avant = x
+        x, y = pas_henon(x, y, a, b)
+        vx, vy = pas_tangent(x_avant if jacobien_avant else x, vx, vy, a, b)
+        norme = np.sqrt(vx * vx + vy * vy)
+        diverge = ~(norme <= seuil) if seuil is not None else None
+        return (x, y, vx / norme, vy / norme, a, b), np.log(norme), None, diverge
+    return pas
+
+def lyapunov_henon_adaptatif(a, b, x0=0.0, y0=0.0, n_transitoire=0, n_max=10000, n_ecart=0,
+                             jacobien_avant=False, seuil=None, bloc=100, blocs_min=5, tol=1e-3):
+    """Version adaptative de lyapunov_henon ; retourne (exposant, demi_largeur, n_pas)."""
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    forme = a.shape
+    a, b = a.ravel(), b.ravel()
+    x = np.full(a.size, x0, dtype=float)
+    y = np.full(a.size, y0, dtype=float)
+    pas = pas_lyapunov_henon(jacobien_avant, seuil)
+    etat = (x, y, np.ones(a.size), np.zeros(a.size), a, b)
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for _ in range(n_transitoire):
+            x, y = pas_henon(x, y, a, b)
+        etat = (x, y) + etat[2:]
+        # Le seuil vaut aussi pendant les pas écartés (comme lyapunov_henon) :
+        # une voie qui le franchit est rendue non finie, donc vaudra nan
+        mort = np.zeros(a.size, dtype=bool)
+        for _ in range(n_ecart):
+            etat, _, _, diverge = pas(etat)
+            if diverge is not None:
+                mort |= diverge
+        etat = (np.where(mort, np.nan, etat[0]),) + etat[1:]
+    resultats = lyapunov_adaptatif(pas, etat, n_max, bloc, blocs_min, tol)
+    return tuple(r.reshape(forme) for r in resultats)
+
+# -------------------------------
+# Logistique
+# -------------------------------
+def pas_lyapunov_logistique(etat):
+    """Pas pour lyapunov_adaptatif, état (x, a) : terme log |a (1 - 2x)|.
+
+    Comme lyapunov_diag_bif_logistique.py, les points hors de [0, 1] et les
+    dérivées hors de ]1e-10, 1e10[ ne comptent pas.
+    """
+    x, a = etat
+    x = a * x * (1.0 - x)
+    derivee = np.abs(a * (1.0 - 2 * x))
+    valide = (x >= 0) & (x <= 1) & (derivee > 1e-10) & (derivee < 1e10)
+    return (x, a), np.log(derivee), valide, None
+
+def lyapunov_logistique_adaptatif(a, x0=0.5, n_transitoire=1000, n_max=5000,
+                                  bloc=100, blocs_min=5, tol=1e-3):
+    """Exposant de l'application logistique ; retourne (exposant, demi_largeur, n_pas)."""
+    a = np.asarray(a, dtype=float)
+    forme = a.shape
+    a = a.ravel()
+    x = np.full(a.size, x0)
+    with np.errstate(over='ignore', invalid='ignore'):
+        for _ in range(n_transitoire):
+            x = a * x * (1.0 - x)
+    resultats = lyapunov_adaptatif(pas_lyapunov_logistique, (x, a), n_max, bloc, blocs_min, tol)
+    return tuple(r.reshape(forme) for r in resultats)
@@ -1,5 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from logistique_lots import lyapunov_bifurcation_logistique
 
 # Paramètres de la simulation
 a_min = 0.0
@@ -10,40 +11,17 @@ n_lyap = 5000  # Itérations pour calcul Lyapunov
 
 # Initialisation
 a_values = np.linspace(a_min, a_max, a_steps)
-lyap_exponents = np.zeros(a_steps)
 
-# Calcul de l'exposant de Lyapunov pour chaque a
-for idx, a in enumerate(a_values):
-    x = 0.5  # Condition initiale
-    
-    # Élimination du transitoire
-    for _ in range(n_transient):
-        x = a * x * (1.0 - x)
-    
-    # Calcul de l'exposant
-    lyap_sum = 0.0
-    valid_points = 0
-    
-    for i in range(n_lyap):
-        x = a * x * (1.0 - x)
-        
-        # Éviter les points où la dérivée n'est pas définie
-        if x < 0 or x > 1:
-            continue
-            
-        # Calcul de la dérivée |f'(x)|
-        derivative = np.abs(a * (1.0 - 2*x))
-        
-        # Éviter les dérivées nulles ou infinies
-        if derivative > 1e-10 and derivative < 1e10:
-            lyap_sum += np.log(derivative)
-            valid_points += 1
-    
-    # Calcul de l'exposant final
-    if valid_points > 0:
-        lyap_exponents[idx] = lyap_sum / valid_points
-    else:
-        lyap_exponents[idx] = np.nan
+# Exposant de Lyapunov et points du diagramme de bifurcation (les 100
+# derniers points de l'orbite) pour toutes les valeurs de a en un seul
+# passage ; les points où la dérivée n'est pas définie, nulle ou infinie
+# sont écartés valeur par valeur
+lyap_exponents, bif = lyapunov_bifurcation_logistique(a_values, 0.5, n_transient, n_lyap, n_bif=100)
+
+# Variante : grille non uniforme, raffinée autour des passages par zéro et
+# des sauts de lambda (transitions : 3.5699..., début de la fenêtre 3 en 3.8284...)
+# from raffinement_lyapunov import raffinement_logistique
+# a_fin, lyap_fin, transitions, sens = raffinement_logistique(a_min, a_max, resolution=1e-5)
 
 # Tracé du résultat
 plt.figure(figsize=(12, 7))
@@ -69,12 +47,7 @@ plt.figure(figsize=(12, 10))
 
 # Diagramme de bifurcation
 plt.subplot(2, 1, 1)
-x = 0.5 * np.ones_like(a_values)
-for _ in range(500):  # Itérations transitoires
-    x = a_values * x * (1.0 - x)
-for _ in range(100):  # Itérations à conserver
-    x = a_values * x * (1.0 - x)
-    plt.plot(a_values, x, '.k', alpha=0.05, markersize=0.5)
+plt.plot(np.broadcast_to(a_values, bif.shape).ravel(), bif.ravel(), '.k', alpha=0.05, markersize=0.5)
 
 #plt.title("Diagramme de bifurcation", fontsize=14)
 plt.ylabel("$x_n$", fontsize=12)
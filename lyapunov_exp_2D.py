@@ -1,40 +1,21 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from tangente_henon import spectre_henon
 
 # --- Paramètres globaux ---
 b = 0.3                      # Valeur fixée de b
 a_vals = np.linspace(1.0, 1.5, 200)  # Plage des valeurs de a
 n_iter = 5000
 transient = 1000
-lyap_max = []
 
-# --- Fonctions de Hénon et Jacobienne ---
-def henon_map(x, y, a, b):
-    x_next = 1 - a * x**2 + y
-    y_next = b * x
-    return x_next, y_next
-
-def jacobian(x, y, a, b):
-    return np.array([[-2 * a * x, 1],
-                     [b,          0]])
-
-# --- Boucle sur les valeurs de a ---
-for a in a_vals:
-    x, y = 0.1, 0.1
-    vecs = np.identity(2)
-    lyap_sum = np.zeros(2)
-
-    for i in range(n_iter):
-        x, y = henon_map(x, y, a, b)
-        if i >= transient:
-            J = jacobian(x, y, a, b)
-            vecs = J @ vecs
-            q, r = np.linalg.qr(vecs)
-            lyap_sum += np.log(np.abs(np.diag(r)))
-            vecs = q
-
-    exponents = lyap_sum / (n_iter - transient)
-    lyap_max.append(np.max(exponents))  # Seulement le plus grand exposant
+# --- Spectre complet pour toutes les valeurs de a à la fois ---
+# Base tangente orthonormalisée par Gram-Schmidt 2x2 écrit en clair (au
+# lieu de np.linalg.qr), les deux exposants en un seul passage ; on obtient
+# aussi la dimension de Kaplan-Yorke et l'écart lambda1 + lambda2 - ln(b)
+lambda1, lambda2, dim_ky, ecart = spectre_henon(a_vals, b, 0.1, 0.1, n_transitoire=transient,
+                                                n_iter=n_iter - transient)
+lyap_max = np.maximum(lambda1, lambda2)  # Seulement le plus grand exposant
+print("Écart maximal à lambda1 + lambda2 = ln(b) :", np.nanmax(np.abs(ecart)))
 
 # --- Affichage du graphique ---
 plt.figure(figsize=(10, 5))
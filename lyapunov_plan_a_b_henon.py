@@ -1,50 +1,23 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from tqdm import tqdm
-
-def henon_map(x, y, a, b):
-    x_next = 1 - a * x**2 + y
-    y_next = b * x
-    return x_next, y_next
-
-def compute_lyapunov_exponent(a, b, N=1000, discard=100):
-    x, y = 0.0, 0.0
-    delta = 1e-8
-    le_sum = 0.0
-
-    # initial perturbation vector
-    dx, dy = delta, 0.0
-
-    for i in range(N + discard):
-        # Current point
-        x1 = x
-
-        # Apply map
-        x, y = henon_map(x, y, a, b)
-
-        # Tangent map (Jacobian at x1, y1)
-        J = np.array([[-2 * a * x1, 1],
-                      [b, 0]])
-
-        # Apply linearized map to perturbation
-        d = np.dot(J, [dx, dy])
-        norm_d = np.linalg.norm(d)
-        dx, dy = d / norm_d  # renormalize
-
-        if i >= discard:
-            le_sum += np.log(norm_d)
-
-    return le_sum / N
+from tangente_henon import lyapunov_henon
 
 # Grid of parameters
 a_vals = np.linspace(1.0, 1.4, 300)
 b_vals = np.linspace(0.2, 0.4, 300)
-LE = np.zeros((len(b_vals), len(a_vals)))
 
+# All (a, b) pairs at once: Jacobian at the point before the step,
+# N = 1000 averaged steps after discard = 100 steps
 print("Computing Lyapunov exponents...")
-for i, b in enumerate(tqdm(b_vals)):
-    for j, a in enumerate(a_vals):
-        LE[i, j] = compute_lyapunov_exponent(a, b)
+LE = lyapunov_henon(a_vals[None, :], b_vals[:, None], 0.0, 0.0, n_ecart=100, n_iter=1000,
+                    jacobien_avant=True)
+
+# Large scans: chunks on all cores, saved to a folder and skipped on restart
+# (under if __name__ == '__main__'); a partial scan assembles with masked cells:
+#from balayage_lyapunov import balayage_plan, assembler_plan
+#balayage_plan('plan_ab', a_vals, b_vals, taille=50, x0=0.0, y0=0.0, n_ecart=100, n_iter=1000,
+#              jacobien_avant=True)
+#a_vals, b_vals, LE = assembler_plan('plan_ab')
 
 # Plot
 plt.figure(figsize=(16, 9))
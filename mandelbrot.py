@@ -1,24 +1,18 @@
 # Re-importation après reset
-import numpy as np
 import matplotlib.pyplot as plt
 
 # Ensemble de Mandelbrot (version large)
-def mandelbrot(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5):
-    x = np.linspace(x_min, x_max, width)
-    y = np.linspace(y_min, y_max, height)
-    X, Y = np.meshgrid(x, y)
-    C = X + 1j * Y
-    Z = np.zeros_like(C)
-    div_time = np.zeros(C.shape, dtype=int)
-
-    for i in range(max_iter):
-        Z = Z**2 + C
-        mask = (np.abs(Z) > 2) & (div_time == 0)
-        div_time[mask] = i
-
-    return x, y, div_time
+# Le moteur compacté n'itère que les pixels qui n'ont pas encore divergé
+from temps_echappement import mandelbrot
 
 x, y, mandelbrot_set = mandelbrot()
+# Variante accélérée pour l'intérieur (pixels intérieurs étiquetés -1) :
+#from temps_echappement import mandelbrot_interieur
+#x, y, mandelbrot_set, gains = mandelbrot_interieur(max_iter=1000)
+#print(gains)
+# Grandes images : rendu par tuiles sur tous les cœurs (sous if __name__ == '__main__') :
+#from rendu_tuiles import mandelbrot_tuiles
+#x, y, mandelbrot_set = mandelbrot_tuiles(8000, 8000, max_iter=1000)
 
 # Affichage
 plt.figure(figsize=(12, 9))
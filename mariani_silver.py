@@ -0,0 +1,124 @@
+import numpy as np
+
+from temps_echappement import echappement_mandelbrot, echappement_julia, mandelbrot_naif
+
+# ================================
+# Subdivision de Mariani–Silver
+# ================================
+# On calcule le bord d'un rectangle ; si tout le bord a la même valeur
+# d'échappement, l'intérieur est rempli sans itérer (les ensembles
+# {temps >= n} sont connexes et sans trou), sinon le rectangle est coupé
+# en quatre. L'argument suppose que le rectangle ne contient pas tout
+# l'ensemble : un rectangle qui contient un point connu de l'ensemble
+# n'est rempli que si son bord est lui-même intérieur.
+# Sur une grille, un filament plus fin qu'un pixel peut laisser des points
+# isolés qu'aucun bord ne voit : les rectangles de côté <= taille_min sont
+# donc calculés entièrement (24 suffit sur FENETRES_REGRESSION).
+# Les rectangles d'une même profondeur sont traités ensemble : tous leurs
+# bords sont calculés en un seul appel au moteur compacté.
+
+def mariani_silver(calcul, height, width, point, valeur_interieure, taille_min=24):
+    """Image (height, width) construite par subdivision.
+
+    calcul(lignes, colonnes) retourne les temps d'échappement des pixels
+    d'indices donnés ; point = (ligne, colonne), éventuellement fractionnaires,
+    d'un point de l'ensemble, dont les pixels valent valeur_interieure.
+    Retourne (img, fraction) où fraction est la part des pixels réellement itérés.
+    """
+    img = np.zeros((height, width), dtype=int)
+    fait = np.zeros((height, width), dtype=bool)
+    itere = [0]
+
+    def calculer(lignes, colonnes):
+        # Pixels pas encore connus, sans doublons (coins, bords partagés)
+        plat = np.unique(lignes * width + colonnes)
+        plat = plat[~fait.ravel()[plat]]
+        if plat.size:
+            l, c = np.divmod(plat, width)
+            img[l, c] = calcul(l, c)
+            fait[l, c] = True
+            itere[0] += l.size
+
+    rectangles = [(0, height - 1, 0, width - 1)]
+    while rectangles:
+        # Bords de tous les rectangles de ce niveau, en un seul calcul
+        bords = []
+        for r0, r1, c0, c1 in rectangles:
+            lignes = np.concatenate([np.full(c1 - c0 + 1, r0), np.full(c1 - c0 + 1, r1),
+                                     np.arange(r0, r1 + 1), np.arange(r0, r1 + 1)])
+            colonnes = np.concatenate([np.arange(c0, c1 + 1), np.arange(c0, c1 + 1),
+                                       np.full(r1 - r0 + 1, c0), np.full(r1 - r0 + 1, c1)])
+            bords.append((lignes, colonnes))
+        calculer(np.concatenate([b[0] for b in bords]), np.concatenate([b[1] for b in bords]))
+
+        suivants = []
+        petits = []
+        for (r0, r1, c0, c1), (lignes, colonnes) in zip(rectangles, bords):
+            if r1 - r0 < 2 or c1 - c0 < 2:
+                continue  # pas d'intérieur
+            valeurs = img[lignes, colonnes]
+            contient = r0 <= point[0] <= r1 and c0 <= point[1] <= c1
+            if np.all(valeurs == valeurs[0]) and (not contient or valeurs[0] == valeur_interieure):
+                img[r0 + 1:r1, c0 + 1:c1] = valeurs[0]
+                fait[r0 + 1:r1, c0 + 1:c1] = True
+            elif r1 - r0 <= taille_min or c1 - c0 <= taille_min:
+                petits.append((r0, r1, c0, c1))
+            else:
+                rm, cm = (r0 + r1) // 2, (c0 + c1) // 2
+                suivants += [(r0, rm, c0, cm), (r0, rm, cm, c1),
+                             (rm, r1, c0, cm), (rm, r1, cm, c1)]
+
+        # Petits rectangles non uniformes : intérieur calculé directement
+        if petits:
+            L, Cc = [], []
+            for r0, r1, c0, c1 in petits:
+                l, c = np.mgrid[r0 + 1:r1, c0 + 1:c1]
+                L.append(l.ravel())
+                Cc.append(c.ravel())
+            calculer(np.concatenate(L), np.concatenate(Cc))
+        rectangles = suivants
+
+    return img, itere[0] / img.size
+
+def mandelbrot_ms(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5, taille_min=24):
+    """Ensemble de Mandelbrot par Mariani–Silver (mêmes valeurs que mandelbrot())."""
+    x = np.linspace(x_min, x_max, width)
+    y = np.linspace(y_min, y_max, height)
+    # c = 0 appartient à l'ensemble ; les pixels intérieurs valent 0
+    point = ((0 - y_min) / (y_max - y_min) * (height - 1), (0 - x_min) / (x_max - x_min) * (width - 1))
+    img, fraction = mariani_silver(lambda l, c: echappement_mandelbrot(x[c] + 1j * y[l], max_iter),
+                                   height, width, point, 0, taille_min)
+    return x, y, img, fraction
+
+def julia_ms(c, width=800, height=800, max_iter=300, xmin=-1.5, xmax=1.5, ymin=-1.5, ymax=1.5, taille_min=24):
+    """Ensemble de Julia rempli par Mariani–Silver (convention de julia_0.py).
+
+    Suppose l'ensemble de Julia connexe, c'est-à-dire c dans l'ensemble de Mandelbrot.
+    """
+    x = np.linspace(xmin, xmax, width)
+    y = np.linspace(ymin, ymax, height)
+    # Le point fixe (1 - sqrt(1 - 4c)) / 2 appartient à l'ensemble de Julia rempli
+    p = (1 - np.sqrt(1 - 4 * complex(c))) / 2
+    point = ((p.imag - ymin) / (ymax - ymin) * (height - 1), (p.real - xmin) / (xmax - xmin) * (width - 1))
+    img, fraction = mariani_silver(lambda l, k: echappement_julia(x[k] + 1j * y[l], c, max_iter),
+                                   height, width, point, max_iter, taille_min)
+    return x, y, img, fraction
+
+# Fenêtres de non-régression (width, height, max_iter, x_min, x_max, y_min, y_max)
+FENETRES_REGRESSION = [
+    (400, 300, 100, -2.5, 1.5, -1.5, 1.5),
+    (400, 300, 500, -0.80, -0.70, 0.05, 0.15),
+    (300, 300, 1000, -0.7463, -0.7413, 0.1102, 0.1152),
+    (300, 300, 300, -1.80, -1.70, -0.05, 0.05),
+]
+
+def verifier_regression(fenetres=FENETRES_REGRESSION):
+    """Compare mandelbrot_ms au calcul naïf ; retourne la fraction itérée par fenêtre."""
+    fractions = []
+    for f in fenetres:
+        _, _, ref = mandelbrot_naif(*f)
+        _, _, img, fraction = mandelbrot_ms(*f)
+        if not np.array_equal(img, ref):
+            raise AssertionError(f"Mariani–Silver diffère du calcul naïf pour {f}")
+        fractions.append(fraction)
+    return fractions
@@ -0,0 +1,404 @@
+import numpy as np
+
+from matplotlib.colors import hsv_to_rgb
+
+from noyaux_iteration import pas_newton
+
+# ================================
+# Bassins de Newton sur toute la grille
+# ================================
+# bassin_newton.py parcourt 801 x 801 pixels en Python, jusqu'à 50 pas de
+# Newton chacun, avec une boucle sur les racines à chaque pas. Ici toute
+# la grille avance d'un pas de Newton à la fois ; la racine la plus proche
+# de chaque pixel est trouvée par un seul calcul de distances (pixels x
+# racines), et les pixels convergés ou divergés sont retirés de l'ensemble
+# actif (compaction). On retrouve l'image de bassin_newton.py : indice de
+# la racine et intensité 1 - (k / ngrand)^0.5 selon le pas k de convergence.
+
+def racines_unite(degre):
+    """Racines de z^degre - 1, dans l'ordre de bassin_newton.py pour degre = 3."""
+    return np.exp(2j * np.pi * np.arange(degre) / degre)
+
+def _grille(np1, np2, x0, x1, y0, y1):
+    """Points de la grille de bassin_newton.py, dans l'orientation de l'image."""
+    pas1 = (x1 - x0) / np1
+    pas2 = (y1 - y0) / np2
+    xa = x0 + np.arange(np1 + 1) * pas1
+    ya = y0 + np.arange(np2 + 1) * pas2
+    # Ligne np2 - j de l'image pour l'ordonnée ya[j]
+    return xa[None, :] + 1j * ya[::-1, None]
+
+def iterer_newton(z, pas_newton_fn, racines, ngrand, tol, exclure_origine=False):
+    """Itère z <- pas_newton_fn(z) sur un tableau plat de points de départ.
+
+    pas_newton_fn(z, p, w) met à jour z en place (p, w : tampons).
+    Retourne (racine, pas) : indice de la racine atteinte à tol près et pas
+    de convergence, -1 sans convergence (divergence, overflow, ou ngrand atteint).
+    tol est un scalaire ou un tableau (une tolérance par racine).
+    exclure_origine : les points |z| < 1e-10 ne sont pas itérés (z^d - 1,
+    dont la dérivée s'annule en 0).
+    """
+    racine = np.full(z.size, -1, dtype=int)
+    pas = np.full(z.size, -1, dtype=int)
+    tol = np.broadcast_to(np.asarray(tol, dtype=float), racines.shape)
+
+    # Éviter la division par zéro
+    idx = np.flatnonzero(np.abs(z) >= 1e-10) if exclure_origine else np.arange(z.size)
+    z = z[idx].astype(complex)
+    p = np.empty_like(z)
+    w = np.empty_like(z)
+
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        for k in range(ngrand):
+            pas_newton_fn(z, p[:z.size], w[:z.size])
+            # Racine la plus proche, pour tous les pixels actifs d'un coup
+            d = np.abs(z[:, None] - racines[None, :])
+            proche = np.argmin(d, axis=1)
+            conv = d[np.arange(z.size), proche] < tol[proche]
+            racine[idx[conv]] = proche[conv]
+            pas[idx[conv]] = k
+            # Retirer les pixels convergés, divergés (overflow) ou indéfinis
+            actifs = ~conv & (np.abs(z) <= 1e10)
+            z, idx = z[actifs], idx[actifs]
+            if idx.size == 0:
+                break
+
+    return racine, pas
+
+def bassins_newton(np1=800, np2=800, ngrand=50, tol=1e-6, x0=-2, x1=2, y0=-2, y1=2, degre=3):
+    """Racine atteinte et pas de convergence pour chaque pixel (Newton sur z^degre - 1).
+
+    Retourne (racine, pas) de forme (np2 + 1, np1 + 1), dans l'orientation
+    de l'image de bassin_newton.py (première ligne : y = y1). racine vaut
+    -1 et pas vaut -1 pour les pixels sans convergence.
+    """
+    Z = _grille(np1, np2, x0, x1, y0, y1)
+    racine, pas = iterer_newton(Z.ravel(), lambda z, p, w: pas_newton(z, degre, p, w),
+                                racines_unite(degre), ngrand, tol, exclure_origine=True)
+    return racine.reshape(Z.shape), pas.reshape(Z.shape)
+
+# ================================
+# Polynômes et fractions rationnelles quelconques
+# ================================
+# Coefficients donnés du plus haut degré au terme constant (convention de
+# np.roots / np.polyval). Les racines sont calculées une seule fois (np.roots :
+# valeurs propres de la matrice compagnon), p et p' sont évalués ensemble par
+# un schéma de Horner vectorisé, et le pas de Newton relaxé
+# z <- z - a f / f' sert pour tous les degrés. Pour f = P / Q :
+# f / f' = P Q / (P' Q - P Q').
+
+def horner(coeffs, z, p, dp):
+    """p <- P(z) et dp <- P'(z) en place (Horner)."""
+    p.fill(coeffs[0])
+    dp.fill(0.0)
+    for c in coeffs[1:]:
+        np.multiply(dp, z, out=dp)
+        np.add(dp, p, out=dp)
+        np.multiply(p, z, out=p)
+        np.add(p, c, out=p)
+
+def _rayon_arrondi(num, r, m):
+    """Distance (eps S / |c|)^(1/m) à laquelle P(z) ~ c (z - r)^m se perd dans l'arrondi."""
+    eps = np.finfo(float).eps
+    c = abs(np.polyval(np.polyder(num, m), r)) / np.prod(np.arange(1, m + 1))
+    S = np.polyval(np.abs(num), abs(r))
+    return (eps * S / max(c, eps))**(1.0 / m)
+
+def _regrouper_racines(num, valeurs, facteur=10.0):
+    """Regroupe les valeurs de np.roots venant d'une même racine multiple.
+
+    Une racine de multiplicité m sort de np.roots en m valeurs à une distance
+    de l'ordre de _rayon_arrondi(num, r, m). Pour chaque valeur, on prend le
+    plus grand m tel que ses m - 1 plus proches voisines et elle tiennent à
+    facteur fois cette distance de leur centre. Retourne (centres, multiplicités).
+    """
+    num = np.asarray(num, dtype=complex)
+    reste = [complex(v) for v in valeurs]
+    centres, tailles = [], []
+    while reste:
+        v = reste[0]
+        ordre = np.argsort([abs(w - v) for w in reste], kind='stable')
+        groupe = [0]
+        for m in range(len(reste), 1, -1):
+            candidats = [reste[k] for k in ordre[:m]]
+            c = np.mean(candidats)
+            if max(abs(w - c) for w in candidats) <= facteur * _rayon_arrondi(num, c, m):
+                groupe = list(ordre[:m])
+                break
+        centres.append(np.mean([reste[k] for k in groupe]))
+        tailles.append(len(groupe))
+        reste = [w for k, w in enumerate(reste) if k not in groupe]
+    return np.array(centres, dtype=complex), np.array(tailles, dtype=int)
+
+def racines_newton(num, den=None, tol_pole=1e-8, multiplicites=False):
+    """Racines distinctes de P (matrice compagnon), sans celles qui annulent aussi Q.
+
+    Les valeurs de np.roots issues d'une même racine multiple sont
+    regroupées en leur moyenne (voir _regrouper_racines). multiplicites=True :
+    retourne aussi la multiplicité de chaque racine.
+    """
+    racines, m = _regrouper_racines(num, np.roots(num))
+    if den is not None:
+        garde = np.abs(np.polyval(den, racines)) > tol_pole
+        racines, m = racines[garde], m[garde]
+    return (racines, m) if multiplicites else racines
+
+def tolerances_racines(num, racines, m, tol):
+    """Tolérance de convergence par racine.
+
+    Avec a = 1, Newton s'arrête de progresser près d'une racine de
+    multiplicité m quand P(z) ~ c (z - r)^m se perd dans l'arrondi
+    eps sum |p_k| |z|^k, soit à |z - r| ~ (eps S / |c|)^(1/m), au-dessus de
+    tol dès m >= 3. La tolérance est le maximum de tol et de dix fois cette
+    distance, bornée au quart de la distance à la racine la plus proche.
+    """
+    num = np.asarray(num, dtype=complex)
+    tols = np.full(racines.size, float(tol))
+    for k, (r, mk) in enumerate(zip(racines, m)):
+        if mk > 1:
+            tols[k] = max(tol, 10.0 * _rayon_arrondi(num, r, mk))
+    if racines.size > 1:
+        ecarts = np.abs(racines[:, None] - racines[None, :])
+        np.fill_diagonal(ecarts, np.inf)
+        tols = np.minimum(tols, 0.25 * ecarts.min(axis=1))
+    return tols
+
+def pas_newton_general(num, den=None, a=1.0):
+    """Fonction pas(z, p, w) : Newton relaxé z <- z - a f / f' pour f = P ou P / Q."""
+    num = np.asarray(num, dtype=complex)
+    if den is None:
+        def pas(z, p, w):
+            horner(num, z, p, w)
+            np.divide(p, w, out=p)
+            np.multiply(p, a, out=p)
+            np.subtract(z, p, out=z)
+        return pas
+
+    den = np.asarray(den, dtype=complex)
+    def pas(z, p, w):
+        q = np.empty_like(z)
+        dq = np.empty_like(z)
+        horner(num, z, p, w)
+        horner(den, z, q, dq)
+        # f / f' = P Q / (P' Q - P Q')
+        np.multiply(w, q, out=w)
+        np.multiply(dq, p, out=dq)
+        np.subtract(w, dq, out=w)
+        np.multiply(p, q, out=p)
+        np.divide(p, w, out=p)
+        np.multiply(p, a, out=p)
+        np.subtract(z, p, out=z)
+    return pas
+
+def bassins_newton_general(num, den=None, a=1.0, np1=800, np2=800, ngrand=50, tol=1e-6,
+                           x0=-2, x1=2, y0=-2, y1=2):
+    """Bassins de Newton pour P (num) ou P / Q (num, den), pas relaxé a.
+
+    Retourne (racine, pas, racines) ; racine indexe le tableau racines.
+    """
+    racines, m = racines_newton(num, den, multiplicites=True)
+    tols = tolerances_racines(num, racines, m, tol)
+    Z = _grille(np1, np2, x0, x1, y0, y1)
+    racine, pas = iterer_newton(Z.ravel(), pas_newton_general(num, den, a), racines, ngrand, tols)
+    return racine.reshape(Z.shape), pas.reshape(Z.shape), racines
+
+# Polynômes à racines multiples : (coefficients, racines distinctes, multiplicités)
+CAS_RACINES_MULTIPLES = [
+    (np.poly([1, 1, 1, 2]), [2, 1], [1, 3]),
+    (np.poly([1, 1, 1, 1, 2]), [2, 1], [1, 4]),
+]
+
+def verifier_racines_multiples(cas=CAS_RACINES_MULTIPLES, n=100, seuil=0.01):
+    """Vérifie racines et multiplicités, et que presque tous les pixels convergent.
+
+    Retourne la part de pixels sans convergence pour chaque cas.
+    """
+    parts = []
+    for num, attendues, multiplicites in cas:
+        racines, m = racines_newton(num, multiplicites=True)
+        ordre = np.argsort(np.real(racines))[::-1]
+        if (not np.allclose(racines[ordre], attendues, atol=1e-6)
+                or not np.array_equal(m[ordre], multiplicites)):
+            raise AssertionError(f"racines {racines} (multiplicités {m}) pour {num}")
+        racine, _, _ = bassins_newton_general(num, np1=n, np2=n)
+        part = np.mean(racine < 0)
+        if part > seuil:
+            raise AssertionError(f"{part:.1%} de pixels sans convergence pour {num}")
+        parts.append(part)
+    return parts
+
+def couleurs_racines(n):
+    """n couleurs réparties sur le cercle chromatique."""
+    teinte = np.arange(n) / n
+    return hsv_to_rgb(np.column_stack((teinte, np.ones(n), np.ones(n))))
+
+def image_bassins(racine, pas, ngrand, couleurs_base=((1, 0, 0), (0, 1, 0), (0, 0, 1))):
+    """Image RGB : couleur de la racine modulée par 1 - (pas / ngrand)^0.5, noir sinon."""
+    couleurs = np.asarray(couleurs_base, dtype=np.float32)
+    image = np.zeros(racine.shape + (3,), dtype=np.float32)
+    conv = racine >= 0
+    intensite = 1.0 - (pas[conv] / ngrand) ** 0.5
+    image[conv] = couleurs[racine[conv] % len(couleurs)] * intensite[:, None]
+    return image
+
+# ================================
+# Raffinement adaptatif des frontières
+# ================================
+# L'information d'une image de bassins est sur les frontières : l'intérieur
+# d'un grand bassin converge en quelques pas vers la même racine. On calcule
+# d'abord les sommets d'une grille grossière (cases de taille pixels), puis
+# une case dont les quatre coins s'accordent (même racine, même bande de
+# pas de convergence) est remplie par interpolation ; les autres sont
+# coupées en quatre et seuls les nouveaux sommets sont calculés, jusqu'à la
+# taille d'un pixel (taille est donc une puissance de deux). La grille est complétée à droite et en bas jusqu'à un
+# multiple de taille, puis recadrée.
+
+def _newton_fonction(degre, num, den, a, tol):
+    """(pas, racines, tolérances) pour z^degre - 1, ou pour P (num) / Q (den) avec relaxation a."""
+    if num is None:
+        return (lambda z, p, w: pas_newton(z, degre, p, w)), racines_unite(degre), tol
+    racines, m = racines_newton(num, den, multiplicites=True)
+    return pas_newton_general(num, den, a), racines, tolerances_racines(num, racines, m, tol)
+
+def bassins_newton_adaptatif(np1=800, np2=800, ngrand=50, tol=1e-6, x0=-2, x1=2, y0=-2, y1=2,
+                             degre=3, num=None, den=None, a=1.0, taille=16, bande=4):
+    """Comme bassins_newton (ou bassins_newton_general si num est donné), par raffinement.
+
+    Retourne (racine, pas, fraction) : fraction est la part des pixels
+    réellement itérés. taille : côté des cases initiales, une puissance de
+    deux. bande : largeur des bandes de pas de convergence qui doivent
+    coïncider aux coins d'une case pour l'interpoler.
+    """
+    if taille < 1 or taille & (taille - 1):
+        raise ValueError("taille doit être une puissance de deux")
+    pas_fn, racines, tols = _newton_fonction(degre, num, den, a, tol)
+    pas1 = (x1 - x0) / np1
+    pas2 = (y1 - y0) / np2
+    H = -(-np2 // taille) * taille + 1
+    W = -(-np1 // taille) * taille + 1
+    racine = np.full((H, W), -1, dtype=int)
+    pas = np.full((H, W), -1, dtype=int)
+    calcule = np.zeros((H, W), dtype=bool)
+
+    def calculer(i, j):
+        """Itère les sommets (i, j) pas encore calculés (i : ligne de l'image)."""
+        cle = np.unique(i * W + j)
+        cle = cle[~calcule.flat[cle]]
+        i, j = np.divmod(cle, W)
+        z = (x0 + j * pas1) + 1j * (y0 + (np2 - i) * pas2)
+        r, k = iterer_newton(z, pas_fn, racines, ngrand, tols, exclure_origine=num is None)
+        racine.flat[cle] = r
+        pas.flat[cle] = k
+        calcule.flat[cle] = True
+
+    # Grille grossière
+    I, J = np.meshgrid(np.arange(0, H, taille), np.arange(0, W, taille), indexing='ij')
+    calculer(I.ravel(), J.ravel())
+    I, J = np.meshgrid(np.arange(0, H - 1, taille), np.arange(0, W - 1, taille), indexing='ij')
+    i0, j0 = I.ravel(), J.ravel()
+
+    s = taille
+    while s > 1 and i0.size:
+        coins_i = np.stack([i0, i0, i0 + s, i0 + s])
+        coins_j = np.stack([j0, j0 + s, j0, j0 + s])
+        r, k = racine[coins_i, coins_j], pas[coins_i, coins_j]
+        uniforme = (r == r[0]).all(axis=0) & ((k // bande) == (k[0] // bande)).all(axis=0)
+
+        # Cases uniformes : racine commune, pas interpolé bilinéairement
+        if uniforme.any():
+            t = np.arange(s + 1)
+            u, v = t[:, None] / s, t[None, :] / s
+            ku = k[:, uniforme].astype(float)
+            interp = ((1 - u) * (1 - v))[None] * ku[0][:, None, None] \
+                + ((1 - u) * v)[None] * ku[1][:, None, None] \
+                + (u * (1 - v))[None] * ku[2][:, None, None] \
+                + (u * v)[None] * ku[3][:, None, None]
+            ii, jj = np.broadcast_arrays(i0[uniforme][:, None, None] + t[None, :, None],
+                                         j0[uniforme][:, None, None] + t[None, None, :])
+            libre = ~calcule[ii, jj]
+            ii, jj = ii[libre], jj[libre]
+            racine[ii, jj] = np.broadcast_to(r[0, uniforme][:, None, None], libre.shape)[libre]
+            pas[ii, jj] = np.rint(interp[libre]).astype(int)
+
+        # Cases non uniformes : nouveaux sommets, puis quatre sous-cases
+        i0, j0 = i0[~uniforme], j0[~uniforme]
+        h = s // 2
+        calculer(np.concatenate([i0 + h, i0, i0 + h, i0 + s, i0 + h]),
+                 np.concatenate([j0, j0 + h, j0 + h, j0 + h, j0 + s]))
+        i0 = np.concatenate([i0, i0, i0 + h, i0 + h])
+        j0 = np.concatenate([j0, j0 + h, j0, j0 + h])
+        s = h
+
+    fraction = np.count_nonzero(calcule[:np2 + 1, :np1 + 1]) / ((np1 + 1) * (np2 + 1))
+    return racine[:np2 + 1, :np1 + 1], pas[:np2 + 1, :np1 + 1], fraction
+
+# ================================
+# Entropie de bassin et exposant d'incertitude
+# ================================
+# Mesures des frontières à partir d'une seule carte des racines, calculée
+# une fois à la résolution la plus fine :
+#   - entropie de bassin S_b : la grille est couverte de boîtes de
+#     boite x boite pixels ; dans chaque boîte, S_i = -sum_j p_ij log p_ij
+#     (p_ij : part des pixels de la boîte dans le bassin j, les pixels sans
+#     convergence comptant comme un bassin), et S_b est la moyenne des S_i ;
+#     l'entropie de frontière S_bb est la moyenne sur les seules boîtes à
+#     plusieurs bassins (S_bb > log 2 : frontière fractale) ;
+#   - exposant d'incertitude alpha : un point est eps-incertain si l'un de
+#     ses voisins à distance eps (horizontale ou verticale) n'a pas la même
+#     racine. Pour eps = 2^m pixels, les voisins sont lus dans la même carte
+#     par décalage de 2^m, sans nouvelle itération. La part f(eps) des
+#     points incertains suit f ~ eps^alpha, et la dimension de boîte de la
+#     frontière vaut D = 2 - alpha.
+
+def entropie_bassins(racine, boite=5):
+    """(S_b, S_bb, nombre de boîtes de frontière) sur des boîtes de boite x boite pixels."""
+    H, W = (racine.shape[0] // boite) * boite, (racine.shape[1] // boite) * boite
+    blocs = racine[:H, :W].reshape(H // boite, boite, W // boite, boite).swapaxes(1, 2)
+    blocs = blocs.reshape(-1, boite * boite)
+    etiquettes = np.unique(racine)
+    p = np.stack([(blocs == e).mean(axis=1) for e in etiquettes], axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        S = -np.where(p > 0, p * np.log(p), 0.0).sum(axis=1)
+    frontiere = (p > 0).sum(axis=1) > 1
+    S_bb = S[frontiere].mean() if frontiere.any() else 0.0
+    return S.mean(), S_bb, int(frontiere.sum())
+
+def fraction_incertaine(racine, decalage):
+    """Part des points dont un voisin à decalage pixels (dans la grille) change de racine."""
+    d = decalage
+    centre = racine[d:-d, d:-d]
+    incertain = (centre != racine[:-2 * d, d:-d]) | (centre != racine[2 * d:, d:-d]) \
+        | (centre != racine[d:-d, :-2 * d]) | (centre != racine[d:-d, 2 * d:])
+    return incertain.mean()
+
+def exposant_incertitude(racine, largeur_pixel, m_max=None):
+    """(epsilons, fractions, alpha, D) pour eps = 2^m pixels, m = 0 .. m_max."""
+    if m_max is None:
+        m_max = int(np.log2(min(racine.shape) / 8))
+    decalages = 2 ** np.arange(m_max + 1)
+    fractions = np.array([fraction_incertaine(racine, d) for d in decalages])
+    epsilons = decalages * largeur_pixel
+    ok = fractions > 0
+    alpha = np.polyfit(np.log(epsilons[ok]), np.log(fractions[ok]), 1)[0] if ok.sum() > 1 else np.nan
+    return epsilons, fractions, alpha, 2.0 - alpha
+
+def analyse_bassins(np1=800, np2=800, ngrand=50, tol=1e-6, x0=-2, x1=2, y0=-2, y1=2,
+                    degre=3, num=None, den=None, a=1.0, boite=5, m_max=None, racine=None):
+    """Entropies et exposant d'incertitude à partir d'une seule carte des racines.
+
+    racine=None : la carte vient d'un passage adaptatif (bassins_newton_adaptatif),
+    qui peut différer de la grille complète en quelques pixels de frontière ;
+    sinon racine est une carte déjà calculée (par exemple par bassins_newton),
+    de forme (np2 + 1, np1 + 1). Retourne (racine, mesures) ; mesures est un
+    dictionnaire.
+    """
+    fraction = np.nan
+    if racine is None:
+        racine, _, fraction = bassins_newton_adaptatif(np1, np2, ngrand, tol, x0, x1, y0, y1,
+                                                       degre, num, den, a)
+    S_b, S_bb, n_frontiere = entropie_bassins(racine, boite)
+    epsilons, fractions, alpha, D = exposant_incertitude(racine, (x1 - x0) / np1, m_max)
+    return racine, {'entropie': S_b, 'entropie_frontiere': S_bb,
+                    'boites_frontiere': n_frontiere, 'frontiere_fractale': S_bb > np.log(2),
+                    'epsilons': epsilons, 'fractions': fractions,
+                    'alpha': alpha, 'dimension': D, 'pixels_iteres': fraction}
@@ -0,0 +1,183 @@
+import numpy as np
+
+# ================================
+# Noyaux d'itération en place
+# ================================
+# Des expressions comme Z = Z**2 + C ou Z[mask] = Z[mask] ** 2 + c allouent
+# plusieurs tableaux temporaires de la taille de l'image à chaque itération.
+# Ici chaque pas écrit dans ses propres tampons (paramètres out=), et tous
+# les tampons viennent d'un espace de travail réutilisé d'une image à
+# l'autre : en régime établi, le rendu n'alloue plus de tableaux de la
+# taille de l'image.
+#
+# Remarque de mesure : avec NumPy, porter z par deux tableaux réels x, y
+# et tester x^2 + y^2 > 4 demande une dizaine de passages mémoire par pas,
+# contre trois pour un tableau complex128 (multiplication complexe et
+# np.abs vectorisées) ; c'était 2 à 3 fois plus lent. Les noyaux gardent
+# donc un stockage complexe et testent |z| > 2 comme temps_echappement.py,
+# ce qui donne exactement les mêmes comptes. La compaction (seule source
+# d'allocation restante) n'a lieu que lorsqu'un quart des pixels actifs
+# ont divergé.
+
+class EspaceTravail:
+    """Tampons nommés, préalloués et réutilisés d'un appel à l'autre."""
+
+    def __init__(self):
+        self._tampons = {}
+
+    def tableau(self, nom, n, dtype=np.complex128):
+        """Vue de longueur n du tampon nom (agrandi seulement si nécessaire)."""
+        t = self._tampons.get(nom)
+        if t is None or t.size < n or t.dtype != np.dtype(dtype):
+            t = np.empty(n, dtype=dtype)
+            self._tampons[nom] = t
+        return t[:n]
+
+    def indices(self, n):
+        """Vue de np.arange(n), calculée une seule fois."""
+        base = self._tampons.get('_arange')
+        if base is None or base.size < n:
+            base = np.arange(n, dtype=np.intp)
+            self._tampons['_arange'] = base
+        return base[:n]
+
+# -------------------------------
+# Pas élémentaires (en place)
+# -------------------------------
+def pas_carre(z, c):
+    """z <- z^2 + c."""
+    np.multiply(z, z, out=z)
+    np.add(z, c, out=z)
+
+def puissance(z, d, p):
+    """p <- z^d, d >= 1 entier, par multiplications répétées."""
+    np.copyto(p, z)
+    for _ in range(d - 1):
+        np.multiply(p, z, out=p)
+
+def pas_puissance(z, c, d, p):
+    """z <- z^d + c (p : tampon)."""
+    puissance(z, d, p)
+    np.add(p, c, out=z)
+
+def pas_newton(z, d, p, w):
+    """Pas de Newton pour z^d - 1 : z <- z - (z^d - 1) / (d z^(d-1)) (p, w : tampons)."""
+    puissance(z, d - 1, w)
+    np.multiply(w, z, out=p)
+    np.subtract(p, 1.0, out=p)
+    np.multiply(w, d, out=w)
+    np.divide(p, w, out=p)
+    np.subtract(z, p, out=z)
+
+# -------------------------------
+# Moteurs de temps d'échappement
+# -------------------------------
+def _echappement(n, max_iter, degre, E, out, julia, c=None):
+    """Boucle compactée sur les tampons 'z', 'idx' (et 'c') de E.
+
+    julia=True : convention de julia_0.py (test avant le pas) ;
+    sinon convention de mandelbrot.py (pas puis test). c scalaire, ou
+    None pour lire un c par pixel dans le tampon 'c'.
+    """
+    par_pixel = c is None
+    noms = ['z', 'idx', 'c'] if par_pixel else ['z', 'idx']
+    types = {'idx': np.intp}
+    cour = {k: E.tableau(k, n, types.get(k, np.complex128)) for k in noms}
+    autre = {k: E.tableau(k + '~', n, types.get(k, np.complex128)) for k in noms}
+    p = E.tableau('p', n)
+    module = E.tableau('module', n, np.float64)
+    esc = E.tableau('esc', n, bool)
+    garde = E.tableau('garde', n, bool)
+
+    def pas(m):
+        cc = cour['c'][:m] if par_pixel else c
+        if degre == 2:
+            pas_carre(cour['z'][:m], cc)
+        else:
+            pas_puissance(cour['z'][:m], cc, degre, p[:m])
+
+    morts = [0]
+
+    def tester(i, m):
+        zc = cour['z'][:m]
+        np.abs(zc, out=module[:m])
+        np.greater(module[:m], 2.0, out=esc[:m])
+        ne = np.count_nonzero(esc[:m])
+        if ne == 0:
+            return m
+        out[cour['idx'][:m][esc[:m]]] = i if (julia or i > 0 or max_iter == 1) else 1
+        # Un pixel échappé devient nan (|nan| > 2 est faux) : il n'est plus
+        # relevé, et on ne compacte que lorsqu'un quart des pixels sont morts
+        zc[esc[:m]] = np.nan
+        morts[0] += ne
+        if morts[0] * 4 < m:
+            return m
+        np.isnan(zc, out=esc[:m])
+        np.logical_not(esc[:m], out=garde[:m])
+        reste = m - morts[0]
+        for k in noms:
+            autre[k][:reste] = cour[k][:m][garde[:m]]
+            cour[k], autre[k] = autre[k], cour[k]
+        morts[0] = 0
+        return reste
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter):
+            if julia:
+                n = tester(i, n)
+                if n == morts[0]:
+                    break
+                pas(n)
+            else:
+                pas(n)
+                n = tester(i, n)
+                if n == morts[0]:
+                    break
+
+def mandelbrot_noyau(C, max_iter, degre=2, espace=None, out=None):
+    """Temps d'échappement de z -> z^degre + c (convention de mandelbrot.py).
+
+    out, s'il est fourni, doit être un tableau d'entiers contigu de même forme.
+    """
+    E = espace if espace is not None else EspaceTravail()
+    n = C.size
+    if out is None:
+        out = np.empty(C.shape, dtype=int)
+    out.fill(0)
+    E.tableau('z', n).fill(0.0)
+    np.copyto(E.tableau('c', n).reshape(C.shape), C)
+    np.copyto(E.tableau('idx', n, np.intp), E.indices(n))
+    _echappement(n, max_iter, degre, E, out.reshape(-1), False)
+    return out
+
+def julia_noyau(Z, c, max_iter, degre=2, espace=None, out=None):
+    """Comptage pour z -> z^degre + c (convention de julia_0.py).
+
+    out, s'il est fourni, doit être un tableau d'entiers contigu de même forme.
+    """
+    E = espace if espace is not None else EspaceTravail()
+    n = Z.size
+    if out is None:
+        out = np.empty(Z.shape, dtype=int)
+    out.fill(max_iter)
+    np.copyto(E.tableau('z', n).reshape(Z.shape), Z)
+    np.copyto(E.tableau('idx', n, np.intp), E.indices(n))
+    _echappement(n, max_iter, degre, E, out.reshape(-1), True, complex(c))
+    return out
+
+def julia_lot_noyau(Z, cs, max_iter, degre=2, espace=None, out=None):
+    """Comptages de plusieurs ensembles de Julia d'un coup.
+
+    Z : grille (H, W) des z0 ; cs : paramètres (B,). Retourne (B, H, W).
+    """
+    E = espace if espace is not None else EspaceTravail()
+    B = len(cs)
+    n = B * Z.size
+    if out is None:
+        out = np.empty((B,) + Z.shape, dtype=int)
+    out.fill(max_iter)
+    np.copyto(E.tableau('z', n).reshape((B,) + Z.shape), Z)
+    np.copyto(E.tableau('c', n).reshape(B, Z.size), np.asarray(cs, dtype=complex)[:, None])
+    np.copyto(E.tableau('idx', n, np.intp), E.indices(n))
+    _echappement(n, max_iter, degre, E, out.reshape(-1), True)
+    return out
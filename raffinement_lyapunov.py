@@ -0,0 +1,62 @@
+import numpy as np
+
+from tangente_henon import lyapunov_henon
+from logistique_lots import lyapunov_bifurcation_logistique
+
+# ================================
+# Raffinement adaptatif en paramètre
+# ================================
+# Une grille uniforme np.linspace(a_min, a_max, a_steps) met la plupart de
+# ses points sur les plages où lambda varie peu, et rate les fenêtres
+# périodiques étroites. On part d'une grille grossière ; un intervalle
+# entre deux points voisins est coupé en deux si lambda y change de signe,
+# y saute de plus de saut, ou passe d'une valeur finie à nan (divergence).
+# Tous les milieux d'une même passe sont calculés ensemble (l'exposant est
+# une fonction vectorisée), jusqu'à ce que les intervalles marqués soient
+# plus courts que resolution. Les changements de signe restants donnent
+# les transitions ordre / chaos, placées par interpolation linéaire.
+
+def raffinement_parametre(exposant, p_min, p_max, n_initial=101, resolution=1e-4, saut=0.1):
+    """Échantillonnage non uniforme de exposant sur [p_min, p_max].
+
+    exposant : fonction d'un tableau de paramètres vers les exposants.
+    Retourne (p, lam, transitions, sens) : points triés et exposants, position
+    des passages par zéro et leur sens (+1 : ordre -> chaos, -1 : chaos -> ordre).
+    """
+    p = np.linspace(p_min, p_max, n_initial)
+    lam = np.asarray(exposant(p), dtype=float)
+
+    while True:
+        g, d = lam[:-1], lam[1:]
+        with np.errstate(invalid='ignore'):
+            marque = (g * d < 0) | (np.abs(d - g) > saut) | (np.isnan(g) != np.isnan(d))
+        marque &= np.diff(p) > resolution
+        if not marque.any():
+            break
+        milieux = 0.5 * (p[:-1][marque] + p[1:][marque])
+        p = np.concatenate([p, milieux])
+        lam = np.concatenate([lam, np.asarray(exposant(milieux), dtype=float)])
+        ordre = np.argsort(p, kind='stable')
+        p, lam = p[ordre], lam[ordre]
+
+    g, d = lam[:-1], lam[1:]
+    with np.errstate(invalid='ignore'):
+        signe = g * d < 0
+    t = g[signe] / (g[signe] - d[signe])
+    transitions = p[:-1][signe] + t * np.diff(p)[signe]
+    sens = np.where(d[signe] > 0, 1, -1)
+    return p, lam, transitions, sens
+
+def raffinement_henon(a_min=0.1, a_max=1.4, b=0.3, n_initial=101, resolution=1e-4, saut=0.1,
+                      n_transitoire=5000, n_lyap=10000, seuil=100):
+    """raffinement_parametre sur a pour Hénon, conventions de lyapunov_Henon.py."""
+    return raffinement_parametre(
+        lambda a: lyapunov_henon(a, b, 0.0, 0.0, n_transitoire=n_transitoire, n_iter=n_lyap, seuil=seuil),
+        a_min, a_max, n_initial, resolution, saut)
+
+def raffinement_logistique(a_min=0.0, a_max=4.0, n_initial=201, resolution=1e-4, saut=0.1,
+                           n_transitoire=1000, n_lyap=5000):
+    """raffinement_parametre sur a pour la logistique, conventions de lyapunov_diag_bif_logistique.py."""
+    return raffinement_parametre(
+        lambda a: lyapunov_bifurcation_logistique(a, 0.5, n_transitoire, n_lyap, n_bif=1)[0],
+        a_min, a_max, n_initial, resolution, saut)
@@ -0,0 +1,69 @@
+import os
+import json
+import numpy as np
+
+from temps_echappement import echappement_mandelbrot, echappement_julia
+
+# ================================
+# Rendu en bandes vers un fichier .npy
+# ================================
+# Pour les très grandes images (40k x 40k), C, Z et div_time ne tiennent
+# pas en mémoire. L'image est calculée par bandes horizontales écrites
+# dans un .npy ouvert en memmap : la mémoire utilisée dépend de la hauteur
+# de bande, pas de la taille de l'image. Un fichier « .bandes » à côté
+# du .npy garde les paramètres (première ligne, JSON) puis l'indice de
+# chaque bande terminée ; un rendu interrompu reprend là où il s'est arrêté.
+
+def _bandes_faites(chemin_bandes, params):
+    if not os.path.exists(chemin_bandes):
+        return None
+    with open(chemin_bandes) as f:
+        lignes = f.read().splitlines()
+    if not lignes or json.loads(lignes[0]) != params:
+        raise ValueError(f"{chemin_bandes} correspond à un autre rendu")
+    return {int(l) for l in lignes[1:] if l.strip()}
+
+def rendu_bandes(chemin, width, height, max_iter, x_min, x_max, y_min, y_max, c=None,
+                 hauteur_bande=256, dtype=np.int64):
+    """Temps d'échappement écrit bande par bande dans le fichier .npy chemin.
+
+    c=None : Mandelbrot (convention de mandelbrot.py), sinon Julia pour ce
+    paramètre (convention de julia_0.py). Retourne l'image en memmap
+    (lecture seule).
+    """
+    # Types Python (et non scalaires NumPy) pour l'en-tête JSON et la forme du .npy
+    width, height, max_iter, hauteur_bande = int(width), int(height), int(max_iter), int(hauteur_bande)
+    x_min, x_max, y_min, y_max = float(x_min), float(x_max), float(y_min), float(y_max)
+    params = {'width': width, 'height': height, 'max_iter': max_iter,
+              'bornes': [x_min, x_max, y_min, y_max],
+              'c': None if c is None else [complex(c).real, complex(c).imag],
+              'hauteur_bande': hauteur_bande, 'dtype': np.dtype(dtype).str}
+    chemin_bandes = chemin + '.bandes'
+    faites = _bandes_faites(chemin_bandes, params)
+    if faites is None or not os.path.exists(chemin):
+        faites = set()
+        img = np.lib.format.open_memmap(chemin, mode='w+', dtype=dtype, shape=(height, width))
+        with open(chemin_bandes + '.tmp', 'w') as f:
+            f.write(json.dumps(params) + '\n')
+        os.replace(chemin_bandes + '.tmp', chemin_bandes)
+    else:
+        img = np.lib.format.open_memmap(chemin, mode='r+')
+
+    x = np.linspace(x_min, x_max, width)
+    y = np.linspace(y_min, y_max, height)
+    for k, r0 in enumerate(range(0, height, hauteur_bande)):
+        if k in faites:
+            continue
+        r1 = min(r0 + hauteur_bande, height)
+        X, Y = np.meshgrid(x, y[r0:r1])
+        if c is None:
+            img[r0:r1] = echappement_mandelbrot(X + 1j * Y, max_iter)
+        else:
+            img[r0:r1] = echappement_julia(X + 1j * Y, c, max_iter)
+        # La bande n'est notée terminée qu'une fois écrite sur disque
+        img.flush()
+        with open(chemin_bandes, 'a') as f:
+            f.write(f"{k}\n")
+
+    del img
+    return np.load(chemin, mmap_mode='r')
@@ -0,0 +1,81 @@
+import numpy as np
+from multiprocessing import Pool, shared_memory
+
+from temps_echappement import echappement_mandelbrot, echappement_mandelbrot_interieur, echappement_julia
+
+# ================================
+# Rendu par tuiles sur plusieurs processus
+# ================================
+# L'image est découpée en petites tuiles distribuées dynamiquement
+# (file de tuiles, une à la fois) : les tuiles intérieures, beaucoup plus
+# coûteuses, n'immobilisent pas un processus pendant que les autres attendent.
+# Chaque processus écrit directement dans un tableau en mémoire partagée,
+# rien n'est renvoyé par pickle.
+
+# État propre à chaque processus (rempli par _init_processus)
+_etat = {}
+
+def tuiles(height, width, taille):
+    """Liste des tuiles (r0, r1, c0, c1) couvrant l'image."""
+    return [(r0, min(r0 + taille, height), c0, min(c0 + taille, width))
+            for r0 in range(0, height, taille)
+            for c0 in range(0, width, taille)]
+
+def _init_processus(nom, forme, x, y, params):
+    shm = shared_memory.SharedMemory(name=nom)
+    _etat['shm'] = shm  # garder une référence tant que le processus vit
+    _etat['img'] = np.ndarray(forme, dtype=np.int64, buffer=shm.buf)
+    _etat['x'], _etat['y'] = x, y
+    _etat['params'] = params
+
+def _calcul_tuile(tuile):
+    r0, r1, c0, c1 = tuile
+    X, Y = np.meshgrid(_etat['x'][c0:c1], _etat['y'][r0:r1])
+    G = X + 1j * Y
+    p = _etat['params']
+    if p['type'] == 'julia':
+        res = echappement_julia(G, p['c'], p['max_iter'])
+    elif p['interieur']:
+        res = echappement_mandelbrot_interieur(G, p['max_iter'])[0]
+    else:
+        res = echappement_mandelbrot(G, p['max_iter'])
+    _etat['img'][r0:r1, c0:c1] = res
+    return tuile
+
+def rendu_tuiles(x, y, max_iter, c=None, interieur=False, taille=64, processus=None):
+    """Temps d'échappement sur la grille (x, y) calculé par tuiles.
+
+    c=None : Mandelbrot (convention de mandelbrot.py, ou INTERIEUR si
+    interieur=True) ; sinon Julia pour ce paramètre (convention de julia_0.py).
+    processus=None utilise tous les cœurs disponibles.
+    """
+    forme = (len(y), len(x))
+    params = {'type': 'mandelbrot' if c is None else 'julia',
+              'c': c, 'max_iter': max_iter, 'interieur': interieur}
+    shm = shared_memory.SharedMemory(create=True, size=int(np.prod(forme)) * 8)
+    try:
+        img = np.ndarray(forme, dtype=np.int64, buffer=shm.buf)
+        with Pool(processus, initializer=_init_processus,
+                  initargs=(shm.name, forme, np.asarray(x), np.asarray(y), params)) as pool:
+            for _ in pool.imap_unordered(_calcul_tuile, tuiles(*forme, taille), chunksize=1):
+                pass
+        resultat = img.copy()
+        del img
+    finally:
+        shm.close()
+        shm.unlink()
+    return resultat
+
+def mandelbrot_tuiles(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5,
+                      interieur=False, taille=64, processus=None):
+    """Ensemble de Mandelbrot rendu en parallèle."""
+    x = np.linspace(x_min, x_max, width)
+    y = np.linspace(y_min, y_max, height)
+    return x, y, rendu_tuiles(x, y, max_iter, interieur=interieur, taille=taille, processus=processus)
+
+def julia_tuiles(c, width=800, height=800, max_iter=300, xmin=-1.5, xmax=1.5, ymin=-1.5, ymax=1.5,
+                 taille=64, processus=None):
+    """Ensemble de Julia rempli rendu en parallèle."""
+    x = np.linspace(xmin, xmax, width)
+    y = np.linspace(ymin, ymax, height)
+    return x, y, rendu_tuiles(x, y, max_iter, c=c, taille=taille, processus=processus)
@@ -0,0 +1,72 @@
+from functools import lru_cache
+
+import numpy as np
+import matplotlib.pyplot as plt
+
+# ================================
+# Densité sur la sphère de Riemann
+# ================================
+# julia_3D.py projette chaque point par des appels xster/yster/zster et
+# envoie tous les points à ax.scatter, inutilisable au-delà de ~10^5
+# points. Ici la projection stéréographique est vectorisée et les points
+# sont comptés dans une grille de la sphère à cases d'aire égale
+# (projection cylindrique de Lambert : cases régulières en longitude phi
+# et en cote Z, chacune d'aire 4 pi / (n_phi n_z)). La sphère est ensuite
+# tracée comme une surface colorée par la densité. Les maillages de la
+# sphère et des géodésiques sont calculés une fois et mis en cache.
+
+def stereographique(z):
+    """Projection stéréographique (X, Y, Z) des points z (comme xster, yster, zster)."""
+    m2 = np.abs(z)**2
+    return 2.0 * np.real(z) / (m2 + 1.0), 2.0 * np.imag(z) / (m2 + 1.0), -(m2 - 1.0) / (m2 + 1.0)
+
+def densite_sphere(z, n_phi=360, n_z=180, comptes=None):
+    """Ajoute à comptes (n_z, n_phi) le nombre de points de z par case d'aire égale."""
+    if comptes is None:
+        comptes = np.zeros((n_z, n_phi), dtype=np.int64)
+    X, Y, Z = stereographique(z)
+    phi = np.arctan2(Y, X)
+    i = np.clip(((Z + 1.0) / 2.0 * n_z).astype(np.int64), 0, n_z - 1)
+    j = np.clip(((phi + np.pi) / (2 * np.pi) * n_phi).astype(np.int64), 0, n_phi - 1)
+    comptes += np.bincount(i * n_phi + j, minlength=n_z * n_phi).reshape(n_z, n_phi)
+    return comptes
+
+class PuitsSphere:
+    """Densité sphérique accumulée bloc par bloc (puits pour consommer)."""
+
+    def __init__(self, n_phi=360, n_z=180):
+        self.comptes = np.zeros((n_z, n_phi), dtype=np.int64)
+
+    def __call__(self, k, z):
+        densite_sphere(z, *self.comptes.shape[::-1], comptes=self.comptes)
+
+@lru_cache(maxsize=None)
+def maillage_sphere(n_phi, n_z):
+    """Sommets (X, Y, Z) des cases d'aire égale, forme (n_z + 1, n_phi + 1)."""
+    phi = np.linspace(-np.pi, np.pi, n_phi + 1)
+    cote = np.linspace(-1.0, 1.0, n_z + 1)
+    rayon = np.sqrt(1.0 - cote**2)
+    return np.outer(rayon, np.cos(phi)), np.outer(rayon, np.sin(phi)), np.outer(cote, np.ones_like(phi))
+
+@lru_cache(maxsize=None)
+def geodesiques(num_geodesics=12, n=100):
+    """Cercles de la sphère utilisés comme repères dans julia_3D.py."""
+    u_geo = np.linspace(0, 2 * np.pi, n)
+    resultat = []
+    for i in range(num_geodesics):
+        theta = i * np.pi / num_geodesics
+        resultat.append((np.cos(u_geo) * np.sin(theta),
+                         np.sin(u_geo) * np.sin(theta),
+                         np.cos(theta) * np.ones_like(u_geo)))
+    return tuple(resultat)
+
+def tracer_densite_sphere(ax, comptes, cmap='inferno'):
+    """Trace la sphère colorée par log(1 + densité) sur un axe 3D."""
+    n_z, n_phi = comptes.shape
+    X, Y, Z = maillage_sphere(n_phi, n_z)
+    valeurs = np.log1p(comptes)
+    valeurs = valeurs / max(valeurs.max(), 1e-12)
+    # plot_surface lit la couleur d'une case au sommet (i, j) : on complète d'une ligne et d'une colonne
+    couleurs = plt.get_cmap(cmap)(np.pad(valeurs, ((0, 1), (0, 1)), mode='edge'))
+    return ax.plot_surface(X, Y, Z, facecolors=couleurs, rcount=n_z, ccount=n_phi,
+                           shade=False, linewidth=0, antialiased=False)
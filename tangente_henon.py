@@ -0,0 +1,136 @@
+import numpy as np
+
+# ================================
+# Application tangente de Hénon, par lots de paramètres
+# ================================
+# Les scripts de Lyapunov itèrent une valeur de paramètre à la fois, en
+# Python, avec un np.array neuf pour la jacobienne à chaque pas et des
+# appels np.linalg.norm / np.dot sur des vecteurs de taille 2. Ici chaque
+# couple (a, b) est une voie d'un tableau plat : l'orbite (x, y) et le
+# vecteur tangent (vx, vy) de toutes les voies avancent d'un pas à la fois.
+# Le produit par J = [[-2 a x, 1], [b, 0]] est écrit en clair :
+#     vx' = -2 a x vx + vy,   vy' = b vx,
+# puis le vecteur est renormalisé voie par voie et log |v'| est accumulé.
+#
+# Les trois scripts diffèrent par quelques conventions, reprises en
+# paramètres : jacobienne évaluée au point après le pas (lyapunov_Henon.py,
+# lyapunov_exp_2D.py) ou avant (lyapunov_plan_a_b_henon.py), transitoire
+# sur l'orbite seule (n_transitoire) ou avec le vecteur tangent (n_ecart),
+# et seuil de divergence sur la norme d'un pas (lyapunov_Henon.py).
+
+def pas_henon(x, y, a, b):
+    """Un pas de l'application de Hénon (tableaux)."""
+    return 1 - a * x**2 + y, b * x
+
+def pas_tangent(x, vx, vy, a, b):
+    """(vx, vy) <- J(x) (vx, vy) pour J = [[-2 a x, 1], [b, 0]]."""
+    return -2 * a * x * vx + vy, b * vx
+
+def lyapunov_henon(a, b, x0=0.0, y0=0.0, n_transitoire=0, n_iter=1000, n_ecart=0,
+                   jacobien_avant=False, seuil=None):
+    """Plus grand exposant de Lyapunov de Hénon pour chaque couple (a, b).
+
+    a et b sont diffusés l'un contre l'autre ; le résultat a leur forme.
+    n_transitoire pas d'orbite seule, puis n_ecart + n_iter pas avec le
+    vecteur tangent, dont seuls les n_iter derniers sont moyennés.
+    jacobien_avant : jacobienne au point avant le pas. seuil : une voie dont
+    la norme d'un pas dépasse seuil (ou est nan) vaut nan et est retirée.
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    forme = a.shape
+    a, b = a.ravel(), b.ravel()
+    x = np.full(a.size, x0, dtype=float)
+    y = np.full(a.size, y0, dtype=float)
+    vx = np.ones(a.size)
+    vy = np.zeros(a.size)
+    somme = np.zeros(a.size)
+    resultat = np.full(a.size, np.nan)
+    idx = np.arange(a.size)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for _ in range(n_transitoire):
+            x, y = pas_henon(x, y, a, b)
+
+        for i in range(n_ecart + n_iter):
+            x_avant = x
+            x, y = pas_henon(x, y, a, b)
+            vx, vy = pas_tangent(x_avant if jacobien_avant else x, vx, vy, a, b)
+            norme = np.sqrt(vx * vx + vy * vy)
+            if seuil is not None:
+                vivant = norme <= seuil
+                if not vivant.all():
+                    # Voies divergentes : nan (déjà dans resultat), retirées
+                    x, y, vx, vy, norme = x[vivant], y[vivant], vx[vivant], vy[vivant], norme[vivant]
+                    a, b, somme, idx = a[vivant], b[vivant], somme[vivant], idx[vivant]
+                    if idx.size == 0:
+                        break
+            vx /= norme
+            vy /= norme
+            if i >= n_ecart:
+                somme += np.log(norme)
+
+    resultat[idx] = somme / n_iter
+    return resultat.reshape(forme)
+
+# ================================
+# Spectre complet : Gram-Schmidt 2x2 en clair
+# ================================
+# lyapunov_exp_2D.py appelle np.linalg.qr sur une matrice 2x2 à chaque pas.
+# Ici la base tangente (u, w) de chaque voie est avancée par J puis
+# orthonormalisée à la main :
+#     r11 = |J u|,  u' = J u / r11,  r12 = u'.J w,
+#     w'' = J w - r12 u',  r22 = |w''|,  w' = w'' / r22,
+# et log r11, log r22 sont accumulés. Pour Hénon |det J| = b, donc
+# lambda1 + lambda2 = ln|b| : l'écart mesure la précision du calcul.
+
+def dimension_kaplan_yorke(lambda1, lambda2):
+    """Dimension de Kaplan-Yorke pour un spectre (lambda1 >= lambda2) de dimension 2."""
+    lambda1, lambda2 = np.asarray(lambda1), np.asarray(lambda2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        d = np.where(lambda1 + lambda2 >= 0, 2.0, 1.0 + lambda1 / np.abs(lambda2))
+    return np.where(lambda1 < 0, 0.0, d)
+
+def spectre_henon(a, b, x0=0.0, y0=0.0, n_transitoire=0, n_iter=1000, n_ecart=0,
+                  jacobien_avant=False):
+    """Spectre de Lyapunov de Hénon pour chaque couple (a, b).
+
+    Mêmes conventions que lyapunov_henon. Retourne (lambda1, lambda2,
+    dimension de Kaplan-Yorke, écart lambda1 + lambda2 - ln|b|).
+    """
+    a, b = np.broadcast_arrays(np.asarray(a, dtype=float), np.asarray(b, dtype=float))
+    forme = a.shape
+    a, b = a.ravel(), b.ravel()
+    x = np.full(a.size, x0, dtype=float)
+    y = np.full(a.size, y0, dtype=float)
+    ux, uy = np.ones(a.size), np.zeros(a.size)
+    wx, wy = np.zeros(a.size), np.ones(a.size)
+    s1 = np.zeros(a.size)
+    s2 = np.zeros(a.size)
+
+    with np.errstate(over='ignore', invalid='ignore', divide='ignore'):
+        for _ in range(n_transitoire):
+            x, y = pas_henon(x, y, a, b)
+
+        for i in range(n_ecart + n_iter):
+            x_avant = x
+            x, y = pas_henon(x, y, a, b)
+            xj = x_avant if jacobien_avant else x
+            ux, uy = pas_tangent(xj, ux, uy, a, b)
+            wx, wy = pas_tangent(xj, wx, wy, a, b)
+            r11 = np.sqrt(ux * ux + uy * uy)
+            ux /= r11
+            uy /= r11
+            r12 = ux * wx + uy * wy
+            wx -= r12 * ux
+            wy -= r12 * uy
+            r22 = np.sqrt(wx * wx + wy * wy)
+            wx /= r22
+            wy /= r22
+            if i >= n_ecart:
+                s1 += np.log(r11)
+                s2 += np.log(r22)
+
+        lambda1 = (s1 / n_iter).reshape(forme)
+        lambda2 = (s2 / n_iter).reshape(forme)
+        ecart = lambda1 + lambda2 - np.log(np.abs(b)).reshape(forme)
+    return lambda1, lambda2, dimension_kaplan_yorke(lambda1, lambda2), ecart
@@ -0,0 +1,270 @@
+import numpy as np
+
+# ================================
+# Moteur de temps d'échappement
+# ================================
+# On ne garde qu'un index compacté des pixels encore « vivants » :
+# à chaque itération seuls ceux-ci sont élevés au carré, et le temps
+# d'échappement est réécrit dans l'image par indice. Le coût d'une
+# itération suit donc la taille de l'ensemble vivant, pas celle de l'image.
+
+def grille(width, height, x_min, x_max, y_min, y_max):
+    """Grille complexe X + iY (comme dans mandelbrot.py et julia_0.py)."""
+    x = np.linspace(x_min, x_max, width)
+    y = np.linspace(y_min, y_max, height)
+    X, Y = np.meshgrid(x, y)
+    return x, y, X + 1j * Y
+
+# ================================
+# Politique de précision
+# ================================
+# Aux zooms faibles (vignettes, aperçus) la simple précision suffit et
+# divise par deux le trafic mémoire de ces boucles. Hypothèse d'erreur :
+# l'arrondi float32 sur c, |c| <= M, vaut au plus eps32 * M / 2 ; on exige
+# qu'un pixel mesure au moins MARGE_FLOAT32 fois eps32 * M, soit une erreur
+# de position inférieure à 1/2048 pixel. Les pixels tout près du bord,
+# sensibles à toute erreur d'arrondi, peuvent encore changer de compte
+# (environ 0.1 % des pixels de la vue par défaut de mandelbrot.py).
+MARGE_FLOAT32 = 2**10
+
+def politique_precision(width, height, max_iter, x_min, x_max, y_min, y_max):
+    """Retourne (dtype complexe, dtype compteur) pour cette fenêtre.
+
+    complex64 si l'écart entre pixels le permet, complex128 sinon ;
+    compteurs uint16 si max_iter y tient, int64 sinon.
+    """
+    pas = min((x_max - x_min) / max(width - 1, 1), (y_max - y_min) / max(height - 1, 1))
+    M = max(abs(x_min), abs(x_max), abs(y_min), abs(y_max), 2.0)
+    if pas >= MARGE_FLOAT32 * np.finfo(np.float32).eps * M:
+        complexe = np.complex64
+    else:
+        complexe = np.complex128
+    compteur = np.uint16 if max_iter <= np.iinfo(np.uint16).max else np.int64
+    return complexe, compteur
+
+def echappement_mandelbrot(C, max_iter, precision=(complex, int)):
+    """Temps d'échappement de z -> z^2 + c, z0 = 0.
+
+    div_time contient l'indice de la première itération où |z| > 2,
+    et 0 pour les pixels qui ne divergent pas (convention de mandelbrot.py).
+    Comme dans la version naïve, un pixel déjà divergé à i = 0 garde
+    div_time == 0 et est donc relevé à nouveau à i = 1.
+    precision = (dtype complexe, dtype compteur), voir politique_precision.
+    """
+    forme = C.shape
+    c = np.ravel(C).astype(precision[0])
+    z = np.zeros_like(c)
+    idx = np.arange(c.size)
+    div_time = np.zeros(c.size, dtype=precision[1])
+
+    for i in range(max_iter):
+        z = z * z + c
+        esc = np.abs(z) > 2
+        if esc.any():
+            # Écriture par indice puis compaction des pixels restants
+            div_time[idx[esc]] = i if (i > 0 or max_iter == 1) else 1
+            vivants = ~esc
+            idx, z, c = idx[vivants], z[vivants], c[vivants]
+            if idx.size == 0:
+                break
+
+    return div_time.reshape(forme)
+
+# Étiquette des pixels reconnus comme intérieurs (mode accéléré)
+INTERIEUR = -1
+
+def dans_cardioide_ou_bulbe(c):
+    """Test analytique : cardioïde principale ou bulbe de période 2."""
+    x, y = np.real(c), np.imag(c)
+    q = (x - 0.25)**2 + y**2
+    cardioide = q * (q + (x - 0.25)) <= 0.25 * y**2
+    bulbe = (x + 1.0)**2 + y**2 <= 1.0 / 16.0
+    return cardioide | bulbe
+
+def echappement_mandelbrot_interieur(C, max_iter, tol=1e-12):
+    """Temps d'échappement avec raccourcis pour l'intérieur de l'ensemble.
+
+    Les points de la cardioïde et du bulbe de période 2 sont rejetés avant
+    d'itérer ; les autres sont arrêtés dès que leur orbite est périodique
+    (détection de Brent : point de référence remplacé aux puissances de 2).
+    Les pixels intérieurs reçoivent INTERIEUR au lieu de 0.
+    Retourne (div_time, gains) où gains donne le nombre d'itérations
+    économisées par chaque raccourci.
+    """
+    forme = C.shape
+    c = np.ravel(C).astype(complex)
+    div_time = np.full(c.size, INTERIEUR, dtype=int)
+    gains = {'cardioide_bulbe': 0, 'periodicite': 0}
+
+    # Rejet analytique avant toute itération
+    rejet = dans_cardioide_ou_bulbe(c)
+    gains['cardioide_bulbe'] = int(rejet.sum()) * max_iter
+    idx = np.flatnonzero(~rejet)
+    c = c[idx]
+    z = np.zeros_like(c)
+    z_ref = z.copy()
+    prochaine = 1
+
+    for i in range(max_iter):
+        z = z * z + c
+        esc = np.abs(z) > 2
+        per = ~esc & (np.abs(z - z_ref) < tol)
+        if esc.any() or per.any():
+            div_time[idx[esc]] = i if (i > 0 or max_iter == 1) else 1
+            # Orbite périodique : le pixel est dans l'ensemble
+            gains['periodicite'] += int(per.sum()) * (max_iter - 1 - i)
+            vivants = ~(esc | per)
+            idx, z, c, z_ref = idx[vivants], z[vivants], c[vivants], z_ref[vivants]
+            if idx.size == 0:
+                break
+        if i + 1 == prochaine:
+            z_ref = z.copy()
+            prochaine *= 2
+
+    return div_time.reshape(forme), gains
+
+def echappement_julia(Z, c, max_iter, precision=(complex, int)):
+    """Nombre d'itérations avec |z| <= 2 pour z -> z^2 + c (convention de julia_0.py).
+
+    Les pixels qui ne divergent pas reçoivent max_iter.
+    precision = (dtype complexe, dtype compteur), voir politique_precision.
+    """
+    forme = Z.shape
+    z = np.ravel(Z).astype(precision[0])
+    c = precision[0](c)
+    idx = np.arange(z.size)
+    img = np.full(z.size, max_iter, dtype=precision[1])
+
+    for i in range(max_iter):
+        esc = np.abs(z) > 2
+        if esc.any():
+            img[idx[esc]] = i
+            vivants = ~esc
+            idx, z = idx[vivants], z[vivants]
+            if idx.size == 0:
+                break
+        z = z * z + c
+
+    return img.reshape(forme)
+
+# ================================
+# Comptage lissé et estimation de distance
+# ================================
+# Dans la même passe on suit la dérivée dz (dz/dc pour Mandelbrot,
+# dz/dz0 pour Julia). À l'échappement, |z| déjà calculé pour le test
+# donne directement :
+#   - le comptage lissé  n + 1 - log2(ln|z| / ln R),
+#   - la distance extérieure  2 |z| ln|z| / |dz|  (majorant ; la vraie
+#     distance au bord est comprise entre ce quart et cette valeur).
+# Un grand rayon R (par ex. 1e3) rend le comptage lissé plus régulier ;
+# le compteur entier est alors relatif à ce rayon.
+
+def _lisse_distance(n, az, adz, rayon):
+    lz = np.log(az)
+    return n + 1 - np.log2(lz / np.log(rayon)), 2 * az * lz / adz
+
+def echappement_mandelbrot_lisse(C, max_iter, rayon=2.0):
+    """Temps d'échappement, comptage lissé et distance au bord (Mandelbrot).
+
+    Retourne (div_time, lisse, distance) ; hors échappement lisse vaut nan
+    et distance 0.
+    """
+    forme = C.shape
+    c = np.ravel(C).astype(complex)
+    z = np.zeros_like(c)
+    dz = np.zeros_like(c)
+    idx = np.arange(c.size)
+    div_time = np.zeros(c.size, dtype=int)
+    lisse = np.full(c.size, np.nan)
+    distance = np.zeros(c.size)
+
+    for i in range(max_iter):
+        dz = 2 * z * dz + 1
+        z = z * z + c
+        az = np.abs(z)
+        esc = az > rayon
+        if esc.any():
+            e = idx[esc]
+            div_time[e] = i if (i > 0 or max_iter == 1) else 1
+            lisse[e], distance[e] = _lisse_distance(i, az[esc], np.abs(dz[esc]), rayon)
+            vivants = ~esc
+            idx, z, dz, c = idx[vivants], z[vivants], dz[vivants], c[vivants]
+            if idx.size == 0:
+                break
+
+    return div_time.reshape(forme), lisse.reshape(forme), distance.reshape(forme)
+
+def echappement_julia_lisse(Z, c, max_iter, rayon=2.0):
+    """Comptage, comptage lissé et distance au bord (Julia, convention de julia_0.py).
+
+    Retourne (img, lisse, distance) ; hors échappement lisse vaut nan
+    et distance 0.
+    """
+    forme = Z.shape
+    z = np.ravel(Z).astype(complex)
+    dz = np.ones_like(z)
+    idx = np.arange(z.size)
+    img = np.full(z.size, max_iter, dtype=int)
+    lisse = np.full(z.size, np.nan)
+    distance = np.zeros(z.size)
+
+    for i in range(max_iter):
+        az = np.abs(z)
+        esc = az > rayon
+        if esc.any():
+            e = idx[esc]
+            img[e] = i
+            lisse[e], distance[e] = _lisse_distance(i, az[esc], np.abs(dz[esc]), rayon)
+            vivants = ~esc
+            idx, z, dz = idx[vivants], z[vivants], dz[vivants]
+            if idx.size == 0:
+                break
+        dz = 2 * z * dz
+        z = z * z + c
+
+    return img.reshape(forme), lisse.reshape(forme), distance.reshape(forme)
+
+# ================================
+# Interfaces des scripts
+# ================================
+def mandelbrot(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5,
+               precision=(complex, int)):
+    """Ensemble de Mandelbrot, moteur compacté.
+
+    precision='auto' applique politique_precision à la fenêtre.
+    """
+    if precision == 'auto':
+        precision = politique_precision(width, height, max_iter, x_min, x_max, y_min, y_max)
+    x, y, C = grille(width, height, x_min, x_max, y_min, y_max)
+    return x, y, echappement_mandelbrot(C, max_iter, precision)
+
+def mandelbrot_interieur(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5, tol=1e-12):
+    """Ensemble de Mandelbrot en mode intérieur accéléré (retourne aussi les gains)."""
+    x, y, C = grille(width, height, x_min, x_max, y_min, y_max)
+    div_time, gains = echappement_mandelbrot_interieur(C, max_iter, tol)
+    return x, y, div_time, gains
+
+def mandelbrot_naif(width=1600, height=1200, max_iter=100, x_min=-2.5, x_max=1.5, y_min=-1.5, y_max=1.5):
+    """Version de référence, itère toute la grille à chaque pas."""
+    x, y, C = grille(width, height, x_min, x_max, y_min, y_max)
+    Z = np.zeros_like(C)
+    div_time = np.zeros(C.shape, dtype=int)
+
+    with np.errstate(over='ignore', invalid='ignore'):
+        for i in range(max_iter):
+            Z = Z**2 + C
+            mask = (np.abs(Z) > 2) & (div_time == 0)
+            div_time[mask] = i
+
+    return x, y, div_time
+
+def julia(c, width=800, height=800, max_iter=300, xmin=-1.5, xmax=1.5, ymin=-1.5, ymax=1.5,
+          precision=(complex, int)):
+    """Ensemble de Julia rempli pour le paramètre c, moteur compacté.
+
+    precision='auto' applique politique_precision à la fenêtre.
+    """
+    if precision == 'auto':
+        precision = politique_precision(width, height, max_iter, xmin, xmax, ymin, ymax)
+    x, y, Z = grille(width, height, xmin, xmax, ymin, ymax)
+    return x, y, echappement_julia(Z, c, max_iter, precision)
@@ -0,0 +1,91 @@
+import numpy as np
+from fractions import Fraction
+
+# ================================
+# Zoom profond par perturbation
+# ================================
+# Au-delà d'une fenêtre d'environ 1e-13, la grille float64 de mandelbrot()
+# ne distingue plus les pixels. On calcule donc une seule orbite de
+# référence Z_n en précision arbitraire (entiers Python en virgule fixe),
+# puis chaque pixel c = c_ref + dc est itéré en float64 comme un écart
+# d_n = z_n - Z_n :
+#     d_{n+1} = (2 Z_n + d_n) d_n + dc
+# Quand |Z_m + d| < |d| (glitch : l'écart domine la référence) ou que
+# l'orbite de référence est épuisée, le pixel est recalé : d <- Z_m + d,
+# m <- 0. Chaque pixel avance donc dans l'orbite de référence avec son
+# propre indice m. Limite : dc doit rester représentable en float64
+# (fenêtres jusqu'à environ 1e-300).
+
+def _fixe(v, prec):
+    """Valeur (chaîne, Fraction, nombre) en virgule fixe à prec bits."""
+    f = Fraction(v)
+    return (f.numerator << prec) // f.denominator
+
+def _vers_float(n, prec):
+    """Entier en virgule fixe -> float64, sans débordement de conversion."""
+    return np.ldexp(float(n >> (prec - 60)), -60)
+
+def orbite_reference(cx, cy, max_iter, prec):
+    """Orbite Z_0 = 0, Z_{n+1} = Z_n^2 + c_ref en virgule fixe (prec bits).
+
+    Retourne les Z_n en complex128 jusqu'à l'échappement ou max_iter.
+    """
+    cr, ci = _fixe(cx, prec), _fixe(cy, prec)
+    quatre = 4 << prec
+    zr = zi = 0
+    Z = [0j]
+    for _ in range(max_iter):
+        zr2 = (zr * zr) >> prec
+        zi2 = (zi * zi) >> prec
+        zr, zi = zr2 - zi2 + cr, ((zr * zi) >> (prec - 1)) + ci
+        Z.append(complex(_vers_float(zr, prec), _vers_float(zi, prec)))
+        if ((zr * zr + zi * zi) >> prec) > quatre:
+            break
+    return np.array(Z)
+
+def mandelbrot_profond(cx, cy, largeur, width=800, height=600, max_iter=1000, prec=None):
+    """Temps d'échappement autour du centre (cx, cy) donné en chaînes décimales.
+
+    largeur est la largeur de la fenêtre en Re(c). Convention de
+    mandelbrot.py : div_time = première itération où |z| > 2, 0 sinon.
+    Retourne (dx, dy, div_time, recalages), dx et dy étant les écarts au
+    centre et recalages le nombre total de recalages sur la référence.
+    """
+    largeur = float(largeur)
+    if prec is None:
+        prec = max(64, int(-np.log2(largeur)) + 64)
+    hauteur = largeur * height / width
+    dx = np.linspace(-largeur / 2, largeur / 2, width)
+    dy = np.linspace(-hauteur / 2, hauteur / 2, height)
+    DX, DY = np.meshgrid(dx, dy)
+
+    Z = orbite_reference(cx, cy, max_iter, prec)
+    fin = len(Z) - 1
+
+    dc = np.ravel(DX + 1j * DY)
+    d = np.zeros_like(dc)
+    m = np.zeros(dc.size, dtype=int)
+    idx = np.arange(dc.size)
+    div_time = np.zeros(dc.size, dtype=int)
+    recalages = 0
+
+    for i in range(max_iter):
+        d = (2 * Z[m] + d) * d + dc
+        m += 1
+        z = Z[m] + d
+        az = np.abs(z)
+        esc = az > 2
+        if esc.any():
+            div_time[idx[esc]] = i
+            vivants = ~esc
+            idx, d, dc, m, z, az = idx[vivants], d[vivants], dc[vivants], m[vivants], z[vivants], az[vivants]
+            if idx.size == 0:
+                break
+        # Recalage des pixels en glitch ou au bout de l'orbite de référence
+        recale = (az < np.abs(d)) | (m == fin)
+        if recale.any():
+            recalages += int(recale.sum())
+            d[recale] = z[recale]
+            m[recale] = 0
+
+    return dx, dy, div_time.reshape(DX.shape), recalages